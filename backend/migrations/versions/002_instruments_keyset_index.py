@@ -0,0 +1,23 @@
+"""Add keyset pagination index on instruments
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_instruments_created_id', 'instruments', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_instruments_created_id', table_name='instruments')
@@ -0,0 +1,27 @@
+"""Add trigram search index on instruments
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX idx_instruments_search_trgm ON instruments "
+        "USING gin ((symbol || ' ' || name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_instruments_search_trgm', table_name='instruments')
@@ -0,0 +1,27 @@
+"""Add composite index for tier-filtered strategy listing
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_strategies_active_public_tier',
+        'strategies',
+        ['is_active', 'is_public', 'tier_required'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_strategies_active_public_tier', table_name='strategies')
@@ -0,0 +1,30 @@
+"""Replace signals created_at index with a (created_at, id) keyset index
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_signals_created_id',
+        'signals',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    op.drop_index('idx_signals_created', table_name='signals')
+
+
+def downgrade() -> None:
+    op.create_index('idx_signals_created', 'signals', ['created_at'])
+    op.drop_index('idx_signals_created_id', table_name='signals')
@@ -0,0 +1,39 @@
+"""Add jsonb_path_ops GIN indexes for JSONB containment lookups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column)
+INDEXES = [
+    ('idx_signals_snapshot_gin', 'signals', 'snapshot'),
+    ('idx_signals_reason_points_gin', 'signals', 'reason_points'),
+    ('idx_strategies_metrics_gin', 'strategies', 'metrics_summary'),
+    ('idx_subscriptions_params_gin', 'subscriptions', 'params'),
+]
+
+
+def upgrade() -> None:
+    for name, table, column in INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,28 @@
+"""Add GIN index on strategies.markets
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_strategies_markets_gin',
+        'strategies',
+        ['markets'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_strategies_markets_gin', table_name='strategies')
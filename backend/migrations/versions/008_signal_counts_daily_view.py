@@ -0,0 +1,39 @@
+"""Add daily per-strategy signal count rollup
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Completed UTC days only, so a refresh never publishes a partial day
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_signal_counts_daily AS
+        SELECT strategy_id,
+               (created_at AT TIME ZONE 'UTC')::date AS day,
+               count(*) AS cnt
+        FROM signals
+        WHERE created_at < date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        GROUP BY strategy_id, day
+        """
+    )
+    # Unique index required by REFRESH ... CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_signal_counts_daily "
+        "ON mv_signal_counts_daily (strategy_id, day)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_signal_counts_daily")
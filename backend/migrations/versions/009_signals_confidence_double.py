@@ -0,0 +1,38 @@
+"""Store signals.confidence as double precision
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'signals',
+        'confidence',
+        type_=sa.Double(),
+        existing_type=sa.Numeric(3, 2),
+        existing_nullable=False,
+        postgresql_using='confidence::double precision',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'signals',
+        'confidence',
+        type_=sa.Numeric(3, 2),
+        existing_type=sa.Double(),
+        existing_nullable=False,
+        postgresql_using='round(confidence::numeric, 2)',
+    )
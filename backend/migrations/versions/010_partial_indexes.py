@@ -0,0 +1,44 @@
+"""Partial indexes for active strategies and pending deliveries
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_strategies_active_partial',
+        'strategies',
+        ['type'],
+        postgresql_where=sa.text('is_active AND is_public'),
+    )
+    op.drop_index('idx_strategies_active', table_name='strategies')
+
+    op.create_index(
+        'idx_delivery_pending',
+        'delivery_plans',
+        ['scheduled_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.drop_index('idx_delivery_status', table_name='delivery_plans')
+    op.drop_index('idx_delivery_scheduled', table_name='delivery_plans')
+
+
+def downgrade() -> None:
+    op.create_index('idx_delivery_scheduled', 'delivery_plans', ['scheduled_at'])
+    op.create_index('idx_delivery_status', 'delivery_plans', ['status'])
+    op.drop_index('idx_delivery_pending', table_name='delivery_plans')
+
+    op.create_index('idx_strategies_active', 'strategies', ['is_active'])
+    op.drop_index('idx_strategies_active_partial', table_name='strategies')
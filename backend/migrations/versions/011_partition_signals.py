@@ -0,0 +1,168 @@
+"""Range-partition signals by created_at into monthly partitions
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created beyond the current month; the create_signal_partitions
+# beat task keeps this window rolling forward afterwards
+MONTHS_AHEAD = 3
+
+
+def _drop_dependents() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_signal_counts_daily")
+    op.drop_constraint('signal_explains_signal_id_fkey', 'signal_explains', type_='foreignkey')
+    op.drop_constraint('delivery_plans_signal_id_fkey', 'delivery_plans', type_='foreignkey')
+
+
+def _create_indexes() -> None:
+    op.create_index('idx_signals_strategy', 'signals', ['strategy_id'])
+    op.create_index('idx_signals_symbol', 'signals', ['symbol'])
+    op.create_index(
+        'idx_signals_created_id',
+        'signals',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    op.create_index('idx_signals_dedup', 'signals', ['dedup_key', 'created_at'])
+    for name, column in (
+        ('idx_signals_snapshot_gin', 'snapshot'),
+        ('idx_signals_reason_points_gin', 'reason_points'),
+    ):
+        op.create_index(
+            name,
+            'signals',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def _create_counts_view() -> None:
+    # Same definition as migration 008
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_signal_counts_daily AS
+        SELECT strategy_id,
+               (created_at AT TIME ZONE 'UTC')::date AS day,
+               count(*) AS cnt
+        FROM signals
+        WHERE created_at < date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+        GROUP BY strategy_id, day
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX idx_mv_signal_counts_daily "
+        "ON mv_signal_counts_daily (strategy_id, day)"
+    )
+
+
+def upgrade() -> None:
+    _drop_dependents()
+    op.execute("ALTER TABLE signals RENAME TO signals_unpartitioned")
+    op.execute(
+        "ALTER TABLE signals_unpartitioned "
+        "RENAME CONSTRAINT signals_pkey TO signals_unpartitioned_pkey"
+    )
+    # created_at becomes part of the key and must route to a partition
+    op.execute("UPDATE signals_unpartitioned SET created_at = now() WHERE created_at IS NULL")
+
+    op.execute(
+        """
+        CREATE TABLE signals (
+            LIKE signals_unpartitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id, created_at),
+            FOREIGN KEY (strategy_id) REFERENCES strategies (id)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # One partition per UTC month from the oldest signal through the window
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month date := date_trunc(
+                'month',
+                coalesce((SELECT min(created_at) FROM signals_unpartitioned), now())
+                    AT TIME ZONE 'UTC'
+            );
+            last_month date := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF signals FOR VALUES FROM (%L) TO (%L)',
+                    'signals_' || to_char(month, 'YYYYMM'),
+                    month::timestamp AT TIME ZONE 'UTC',
+                    (month + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+                month := month + interval '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("INSERT INTO signals SELECT * FROM signals_unpartitioned")
+    op.drop_table('signals_unpartitioned')
+
+    _create_indexes()
+    _create_counts_view()
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_signal_counts_daily")
+    op.execute("ALTER TABLE signals RENAME TO signals_partitioned")
+    op.execute(
+        "ALTER TABLE signals_partitioned "
+        "RENAME CONSTRAINT signals_pkey TO signals_partitioned_pkey"
+    )
+    # Partitioned index names are global; free them for the plain table
+    for name in (
+        'idx_signals_strategy',
+        'idx_signals_symbol',
+        'idx_signals_created_id',
+        'idx_signals_dedup',
+        'idx_signals_snapshot_gin',
+        'idx_signals_reason_points_gin',
+    ):
+        op.drop_index(name, table_name='signals_partitioned')
+
+    op.execute(
+        """
+        CREATE TABLE signals (
+            LIKE signals_partitioned INCLUDING DEFAULTS,
+            PRIMARY KEY (id),
+            FOREIGN KEY (strategy_id) REFERENCES strategies (id)
+        )
+        """
+    )
+    op.execute("INSERT INTO signals SELECT * FROM signals_partitioned")
+    # Drops the monthly partitions with it
+    op.execute("DROP TABLE signals_partitioned")
+
+    _create_indexes()
+    op.create_foreign_key(
+        'signal_explains_signal_id_fkey',
+        'signal_explains',
+        'signals',
+        ['signal_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'delivery_plans_signal_id_fkey',
+        'delivery_plans',
+        'signals',
+        ['signal_id'],
+        ['id'],
+    )
+    _create_counts_view()
@@ -0,0 +1,50 @@
+"""Add integer strategies.tier_level for range filtering by tier
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'strategies',
+        sa.Column('tier_level', sa.SmallInteger(), nullable=False, server_default='0'),
+    )
+    # Same ranks as TIER_LEVELS in src/core/constants.py
+    op.execute(
+        """
+        UPDATE strategies SET tier_level = CASE tier_required
+            WHEN 'pro' THEN 1
+            WHEN 'enterprise' THEN 2
+            ELSE 0
+        END
+        """
+    )
+    op.create_index(
+        'idx_strategies_public_tier_level',
+        'strategies',
+        ['tier_level'],
+        postgresql_where=sa.text('is_active AND is_public'),
+    )
+    op.drop_index('idx_strategies_active_public_tier', table_name='strategies')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_strategies_active_public_tier',
+        'strategies',
+        ['is_active', 'is_public', 'tier_required'],
+    )
+    op.drop_index('idx_strategies_public_tier_level', table_name='strategies')
+    op.drop_column('strategies', 'tier_level')
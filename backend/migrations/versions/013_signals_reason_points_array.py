@@ -0,0 +1,31 @@
+"""Normalize signals.reason_points to a JSON array
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Legacy rows stored {"points": [...]}; unwrap them in place
+    op.execute(
+        """
+        UPDATE signals
+        SET reason_points = coalesce(reason_points -> 'points', '[]'::jsonb)
+        WHERE jsonb_typeof(reason_points) = 'object'
+        """
+    )
+
+
+def downgrade() -> None:
+    # Arrays remain valid under the old read path; nothing to undo
+    pass
@@ -0,0 +1,33 @@
+"""Index signals by a 16-byte dedup_hash instead of dedup_key
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('signals', sa.Column('dedup_hash', sa.LargeBinary(16)))
+    # Same digest as src.infra.database.models.dedup_hash
+    op.execute(
+        "UPDATE signals SET dedup_hash = decode(md5(dedup_key), 'hex') "
+        "WHERE dedup_key IS NOT NULL"
+    )
+    op.create_index('idx_signals_dedup_hash', 'signals', ['dedup_hash', 'created_at'])
+    op.drop_index('idx_signals_dedup', table_name='signals')
+
+
+def downgrade() -> None:
+    op.create_index('idx_signals_dedup', 'signals', ['dedup_key', 'created_at'])
+    op.drop_index('idx_signals_dedup_hash', table_name='signals')
+    op.drop_column('signals', 'dedup_hash')
@@ -0,0 +1,35 @@
+"""Replace the signals keyset index with a covering feed index
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_signals_feed_covering',
+        'signals',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_include=['strategy_id', 'symbol', 'market', 'side'],
+    )
+    op.drop_index('idx_signals_created_id', table_name='signals')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_signals_created_id',
+        'signals',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+    op.drop_index('idx_signals_feed_covering', table_name='signals')
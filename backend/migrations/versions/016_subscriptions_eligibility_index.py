@@ -0,0 +1,27 @@
+"""Add composite index for eligible-subscription lookups
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_subscriptions_strategy_status_last',
+        'subscriptions',
+        ['strategy_id', 'status', 'last_signal_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_subscriptions_strategy_status_last', table_name='subscriptions')
@@ -0,0 +1,35 @@
+"""Narrow the eligibility index to active subscriptions
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_subscriptions_eligible',
+        'subscriptions',
+        ['strategy_id', 'last_signal_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+    op.drop_index('idx_subscriptions_strategy_status_last', table_name='subscriptions')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'idx_subscriptions_strategy_status_last',
+        'subscriptions',
+        ['strategy_id', 'status', 'last_signal_at'],
+    )
+    op.drop_index('idx_subscriptions_eligible', table_name='subscriptions')
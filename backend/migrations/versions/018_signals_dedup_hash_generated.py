@@ -0,0 +1,36 @@
+"""Generate signals.dedup_hash in the database
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEDUP_HASH_SQL = "decode(md5(dedup_key), 'hex')"
+
+
+def upgrade() -> None:
+    # A plain column cannot be turned into a generated one; dropping it also
+    # drops idx_signals_dedup_hash
+    op.drop_column('signals', 'dedup_hash')
+    op.add_column(
+        'signals',
+        sa.Column('dedup_hash', sa.LargeBinary(16), sa.Computed(DEDUP_HASH_SQL, persisted=True)),
+    )
+    op.create_index('idx_signals_dedup_hash', 'signals', ['dedup_hash', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_column('signals', 'dedup_hash')
+    op.add_column('signals', sa.Column('dedup_hash', sa.LargeBinary(16)))
+    op.execute(f"UPDATE signals SET dedup_hash = {DEDUP_HASH_SQL} WHERE dedup_key IS NOT NULL")
+    op.create_index('idx_signals_dedup_hash', 'signals', ['dedup_hash', 'created_at'])
@@ -0,0 +1,36 @@
+"""Add a DEFAULT partition to signals
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Catches rows beyond the pre-created months so inserts never fail if
+    # the create_signal_partitions beat task stalls
+    op.execute("CREATE TABLE signals_default PARTITION OF signals DEFAULT")
+
+
+def downgrade() -> None:
+    # Rows here would have no partition to go to; refuse rather than lose them
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM signals_default) THEN
+                RAISE EXCEPTION 'signals_default is not empty; create the missing partitions first';
+            END IF;
+        END $$
+        """
+    )
+    op.execute("DROP TABLE signals_default")
@@ -7,6 +7,8 @@ from typing import Any, TypedDict
 
 from langchain_core.messages import BaseMessage
 
+from src.core.time import utcnow
+
 
 # ==================== Agent 类型枚举 ====================
 
@@ -139,7 +141,7 @@ class AgentInput:
     content: dict[str, Any]
     context: dict[str, Any] = field(default_factory=dict)
     metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
 
 
 @dataclass
@@ -155,7 +157,7 @@ class AgentOutput:
     error: str | None = None
     execution_time_ms: float = 0
     token_usage: dict[str, int] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
 
     def to_dict(self) -> dict[str, Any]:
         """转换为字典."""
@@ -184,7 +186,7 @@ class Decision:
     risk_factors: list[str] = field(default_factory=list)
     supporting_data: dict[str, Any] = field(default_factory=dict)
     recommended_action: str = ""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
 
     @property
     def confidence_level(self) -> ConfidenceLevel:
@@ -224,7 +226,7 @@ class ToolCall:
     result: Any = None
     error: str | None = None
     execution_time_ms: float = 0
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
 
 
 # ==================== 错误类型 ====================
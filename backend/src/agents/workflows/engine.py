@@ -26,6 +26,7 @@ class WorkflowEngine:
         self._nodes: dict[str, Callable] = {}
         self._edges: list[tuple[str, str]] = []
         self._conditional_edges: list[tuple[str, Callable, dict[str, str]]] = []
+        self._mermaid_cache: str | None = None
 
     def add_node(
         self,
@@ -43,6 +44,7 @@ class WorkflowEngine:
         """
         self._nodes[name] = handler
         self._graph.add_node(name, handler)
+        self._mermaid_cache = None
         return self
 
     def add_edge(self, from_node: str, to_node: str) -> "WorkflowEngine":
@@ -57,6 +59,7 @@ class WorkflowEngine:
         """
         self._edges.append((from_node, to_node))
         self._graph.add_edge(from_node, to_node)
+        self._mermaid_cache = None
         return self
 
     def add_conditional_edge(
@@ -77,6 +80,7 @@ class WorkflowEngine:
         """
         self._conditional_edges.append((from_node, condition, path_map))
         self._graph.add_conditional_edges(from_node, condition, path_map)
+        self._mermaid_cache = None
         return self
 
     def set_entry_point(self, node: str) -> "WorkflowEngine":
@@ -89,6 +93,7 @@ class WorkflowEngine:
             self，支持链式调用
         """
         self._graph.add_edge(START, node)
+        self._mermaid_cache = None
         return self
 
     def set_finish_point(self, node: str) -> "WorkflowEngine":
@@ -101,6 +106,7 @@ class WorkflowEngine:
             self，支持链式调用
         """
         self._graph.add_edge(node, END)
+        self._mermaid_cache = None
         return self
 
     def compile(self) -> CompiledStateGraph:
@@ -158,14 +164,19 @@ class WorkflowEngine:
     def visualize(self) -> str:
         """可视化工作流 (返回 Mermaid 格式).
 
+        结果按拓扑缓存，图结构变更 (添加节点/边) 时失效。
+
         Returns:
             Mermaid 格式的图描述
         """
+        if self._mermaid_cache is not None:
+            return self._mermaid_cache
+
         if self._compiled is None:
             self.compile()
 
         try:
-            return self._compiled.get_graph().draw_mermaid()  # type: ignore
+            mermaid = self._compiled.get_graph().draw_mermaid()  # type: ignore
         except Exception:
             # 手动生成简单的 Mermaid 图
             lines = ["graph TD"]
@@ -174,7 +185,10 @@ class WorkflowEngine:
             for from_node, _, path_map in self._conditional_edges:
                 for condition, to_node in path_map.items():
                     lines.append(f"    {from_node} -->|{condition}| {to_node}")
-            return "\n".join(lines)
+            mermaid = "\n".join(lines)
+
+        self._mermaid_cache = mermaid
+        return mermaid
 
 
 class MultiAgentWorkflow(WorkflowEngine):
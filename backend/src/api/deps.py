@@ -22,6 +22,7 @@ from src.services import (
     NotificationService,
 )
 from src.domain.entities.user import UserEntity
+from src.core.constants import UserRole, UserTier, TIER_LEVELS
 from src.core.security import verify_access_token
 from src.core.exceptions import InvalidTokenError
 
@@ -140,15 +141,12 @@ async def get_optional_user(
 
 def require_tier(min_tier: str):
     """Dependency factory: require minimum user tier."""
-    from src.core.constants import UserTier
-
-    tier_order = {UserTier.FREE: 0, UserTier.PRO: 1, UserTier.ENTERPRISE: 2}
+    min_level = TIER_LEVELS.get(UserTier(min_tier), 0)
 
     async def checker(
         current_user: Annotated[UserEntity, Depends(get_current_user)],
     ) -> UserEntity:
-        min_tier_enum = UserTier(min_tier)
-        if tier_order.get(current_user.tier, 0) < tier_order.get(min_tier_enum, 0):
+        if TIER_LEVELS.get(current_user.tier, 0) < min_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Requires {min_tier} tier or above",
@@ -160,8 +158,6 @@ def require_tier(min_tier: str):
 
 def require_admin():
     """Dependency: require admin role."""
-    from src.core.constants import UserRole
-
     async def checker(
         current_user: Annotated[UserEntity, Depends(get_current_user)],
     ) -> UserEntity:
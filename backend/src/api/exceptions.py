@@ -1,7 +1,9 @@
 """API exception handlers."""
 
-from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from functools import lru_cache
+
+import orjson
+from fastapi import FastAPI, Request, Response, status
 
 from src.core.exceptions import (
     SignalFlowError,
@@ -12,6 +14,13 @@ from src.core.exceptions import (
     BusinessError,
     RateLimitError,
 )
+from src.core.json_response import ORJSONResponse
+
+
+@lru_cache(maxsize=64)
+def _rate_limit_body(message: str) -> bytes:
+    """Pre-encoded 429 body; the message only varies with retry_after."""
+    return orjson.dumps({"error": "rate_limit_exceeded", "message": message})
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -19,7 +28,7 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(AuthenticationError)
     async def authentication_error_handler(request: Request, exc: AuthenticationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"error": "authentication_error", "message": exc.message},
             headers={"WWW-Authenticate": "Bearer"},
@@ -27,21 +36,21 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(AuthorizationError)
     async def authorization_error_handler(request: Request, exc: AuthorizationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"error": "authorization_error", "message": exc.message},
         )
 
     @app.exception_handler(NotFoundError)
     async def not_found_error_handler(request: Request, exc: NotFoundError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"error": "not_found", "message": exc.message},
         )
 
     @app.exception_handler(ValidationError)
     async def validation_error_handler(request: Request, exc: ValidationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "validation_error",
@@ -52,7 +61,7 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(BusinessError)
     async def business_error_handler(request: Request, exc: BusinessError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"error": "business_error", "message": exc.message},
         )
@@ -62,15 +71,16 @@ def register_exception_handlers(app: FastAPI) -> None:
         headers = {}
         if exc.retry_after:
             headers["Retry-After"] = str(exc.retry_after)
-        return JSONResponse(
+        return Response(
+            content=_rate_limit_body(exc.message),
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={"error": "rate_limit_exceeded", "message": exc.message},
             headers=headers,
+            media_type="application/json",
         )
 
     @app.exception_handler(SignalFlowError)
     async def signalflow_error_handler(request: Request, exc: SignalFlowError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"error": "internal_error", "message": exc.message},
         )
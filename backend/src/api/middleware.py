@@ -1,60 +1,110 @@
-"""API middleware."""
+"""API middleware.
 
+Both middlewares are plain ASGI callables rather than ``BaseHTTPMiddleware``
+subclasses, so a request passes through without the extra task group and
+response streaming wrapper Starlette allocates per request.
+"""
+
+import logging
 import time
-import uuid
-from typing import Callable
+from os import urandom
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.config import settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# High-QPS paths that are not worth an access log line
+SKIP_PATHS = frozenset({"/health", "/metrics", "/favicon.ico"})
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Add request ID to each request."""
+_now = time.perf_counter
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
+# Uvicorn's access log is disabled, so this is the only per-request line.
+# Production can raise ACCESS_LOG_LEVEL above LOG_LEVEL to drop it.
+_ACCESS_LOG_LEVEL = logging.getLevelName(settings.access_log_level.upper())
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
 
-        return response
+class RequestIdMiddleware:
+    """Add request ID to each request."""
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Log requests and responses."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        request_id = getattr(request.state, "request_id", "unknown")
+        rid_bytes: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                rid_bytes = value
+                break
+        if rid_bytes is None:
+            request_id = urandom(16).hex()
+            rid_bytes = request_id.encode("ascii")
+        else:
+            request_id = rid_bytes.decode("latin-1")
 
-        logger.info(
-            "Request started",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client=request.client.host if request.client else "unknown",
-        )
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-request-id", rid_bytes))
+                message["headers"] = headers
+            await send(message)
 
-        duration_ms = (time.time() - start_time) * 1000
+        await self.app(scope, receive, send_wrapper)
 
-        logger.info(
-            "Request completed",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
+
+class LoggingMiddleware:
+    """Log requests and responses."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        t0 = _now()
+        await self.app(scope, receive, send_wrapper)
+        duration_ms = (_now() - t0) * 1000.0
+
+        level = logging.ERROR if status_code >= 500 else _ACCESS_LOG_LEVEL
+        if not logging.getLogger().isEnabledFor(level):
+            return
+
+        client = scope.get("client")
+        logger.log(
+            level,
+            "request",
+            request_id=scope.get("state", {}).get("request_id", "unknown"),
+            method=scope["method"],
+            path=path,
+            client=client[0] if client else "unknown",
+            status_code=status_code,
             duration_ms=round(duration_ms, 2),
         )
 
-        return response
-
 
 def register_middleware(app: FastAPI) -> None:
     """Register middleware for the application."""
@@ -8,6 +8,7 @@ from pydantic import BaseModel, EmailStr
 from src.api.deps import get_user_service
 from src.services.user_service import UserService
 from src.core.exceptions import EmailAlreadyExistsError, InvalidCredentialsError
+from src.core.security import verify_refresh_token, create_access_token, create_refresh_token
 
 router = APIRouter(prefix="/auth")
 
@@ -49,15 +50,11 @@ async def register(
 ):
     """Register a new user."""
     try:
-        user = await user_service.register(
+        user_entity, access_token, refresh_token = await user_service.register(
             email=request.email,
             password=request.password,
             nickname=request.nickname,
-        )
-
-        user_entity, access_token, refresh_token = await user_service.authenticate(
-            email=request.email,
-            password=request.password,
+            issue_tokens=True,
         )
 
         return AuthResponse(
@@ -65,8 +62,8 @@ async def register(
                 id=str(user_entity.id),
                 email=user_entity.email,
                 nickname=user_entity.nickname,
-                role=user_entity.role.value,
-                tier=user_entity.tier.value,
+                role=user_entity.role,
+                tier=user_entity.tier,
             ),
             tokens=TokenResponse(
                 access_token=access_token,
@@ -97,8 +94,8 @@ async def login(
                 id=str(user.id),
                 email=user.email,
                 nickname=user.nickname,
-                role=user.role.value,
-                tier=user.tier.value,
+                role=user.role,
+                tier=user.tier,
             ),
             tokens=TokenResponse(
                 access_token=access_token,
@@ -122,8 +119,6 @@ async def refresh_token(
     user_service: Annotated[UserService, Depends(get_user_service)],
 ):
     """Refresh access token using refresh token."""
-    from src.core.security import verify_refresh_token, create_access_token, create_refresh_token
-
     payload = verify_refresh_token(request.refresh_token)
     if not payload:
         raise HTTPException(
@@ -131,11 +126,16 @@ async def refresh_token(
             detail="Invalid or expired refresh token",
         )
 
+    # The refresh token already proves the user id; only tokens issued
+    # before the email claim was added need a user lookup.
     user_id = payload.get("sub")
-    user = await user_service.get_by_id(user_id)
+    email = payload.get("email")
+    if email is None:
+        user = await user_service.get_by_id(user_id)
+        user_id, email = str(user.id), user.email
 
-    access_token = create_access_token({"sub": str(user.id), "email": user.email})
-    new_refresh_token = create_refresh_token({"sub": str(user.id)})
+    access_token = create_access_token({"sub": user_id, "email": email})
+    new_refresh_token = create_refresh_token({"sub": user_id, "email": email})
 
     return TokenResponse(
         access_token=access_token,
@@ -1,22 +1,26 @@
 """Instrument endpoints."""
 
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from pydantic import BaseModel
-from sqlalchemy import select
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import func, lambda_stmt, literal_column, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_optional_user
+from src.core.json_response import ORJSONResponse
 from src.infra.database import get_db
-from src.infra.database.models import Instrument
+from src.infra.database.models import Instrument, Signal
 from src.domain.entities.user import UserEntity
+from src.domain.value_objects.pagination import CursorPagination
 
 router = APIRouter(prefix="/instruments")
 
 
 class InstrumentResponse(BaseModel):
-    id: str
+    id: UUID
     symbol: str
     name: str
     market: str
@@ -28,51 +32,113 @@ class InstrumentResponse(BaseModel):
 
 class InstrumentsListResponse(BaseModel):
     items: list[InstrumentResponse]
-    total: int
-
-
-@router.get("", response_model=InstrumentsListResponse)
+    total: int | None
+    next_cursor: str | None
+    has_more: bool
+
+
+# Validates and serializes a whole page in one pydantic-core call
+_INSTRUMENT_LIST_ADAPTER = TypeAdapter(list[InstrumentResponse])
+
+# Must match the idx_instruments_search_trgm expression for the index to apply
+_SEARCH_TEXT = Instrument.symbol.op("||")(literal_column("' '")).op("||")(Instrument.name)
+
+# Base statement for list_instruments, built once and cloned per request
+_LIST_INSTRUMENTS = select(
+    Instrument.id,
+    Instrument.symbol,
+    Instrument.name,
+    Instrument.market,
+    Instrument.type,
+    Instrument.exchange,
+    Instrument.currency,
+    Instrument.is_active,
+    Instrument.created_at,
+).where(Instrument.is_active == True)
+
+
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": InstrumentsListResponse}},
+)
 async def list_instruments(
     session: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[UserEntity | None, Depends(get_optional_user)],
     market: str | None = None,
     type: str | None = None,
     q: str | None = None,
+    cursor: str | None = None,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=200),
 ):
-    """List instruments with filters."""
-    query = select(Instrument).where(Instrument.is_active == True)
+    """List instruments with filters.
+
+    Pages either by ``skip`` (with the full ``total``) or by keyset ``cursor``
+    taken from a previous ``next_cursor``; cursor pages omit ``total``.
+    """
+    # Project only the response columns; rows come back as plain tuples
+    query = _LIST_INSTRUMENTS
 
     if market:
         query = query.where(Instrument.market == market)
     if type:
         query = query.where(Instrument.type == type)
     if q:
-        query = query.where(
-            Instrument.symbol.ilike(f"%{q}%") | Instrument.name.ilike(f"%{q}%")
-        )
-
-    query = query.offset(skip).limit(limit)
+        query = query.where(_SEARCH_TEXT.ilike(f"%{q}%"))
+
+    cursor_data = CursorPagination(cursor=cursor).decode_cursor()
+    if cursor_data:
+        try:
+            cursor_key = (
+                datetime.fromisoformat(cursor_data["created_at"]),
+                UUID(cursor_data["id"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            ) from None
+        query = query.where(tuple_(Instrument.created_at, Instrument.id) < tuple_(*cursor_key))
+    else:
+        # Total matching rows, computed before OFFSET/LIMIT in the same query
+        query = query.add_columns(func.count().over().label("total")).offset(skip)
+
+    query = query.order_by(Instrument.created_at.desc(), Instrument.id.desc()).limit(limit + 1)
     result = await session.execute(query)
-    instruments = list(result.scalars().all())
-
-    return InstrumentsListResponse(
-        items=[
-            InstrumentResponse(
-                id=str(i.id),
-                symbol=i.symbol,
-                name=i.name,
-                market=i.market.value,
-                type=i.type.value,
-                exchange=i.exchange,
-                currency=i.currency,
-                is_active=i.is_active,
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    total = None
+    if not cursor_data:
+        if rows:
+            total = rows[0].total
+        elif skip == 0:
+            total = 0
+        else:
+            total = await session.scalar(
+                select(func.count()).select_from(
+                    query.limit(None).offset(None).order_by(None).subquery()
+                )
             )
-            for i in instruments
-        ],
-        total=len(instruments),
-    )
+
+    next_cursor = None
+    if has_more:
+        next_cursor = CursorPagination.encode_cursor({
+            "created_at": rows[-1].created_at,
+            "id": rows[-1].id,
+        })
+
+    items = _INSTRUMENT_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+
+    return ORJSONResponse({
+        "items": _INSTRUMENT_LIST_ADAPTER.dump_python(items, mode="json"),
+        "total": total,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    })
 
 
 @router.get("/{symbol}", response_model=InstrumentResponse)
@@ -82,11 +148,11 @@ async def get_instrument(
     market: str | None = None,
 ):
     """Get instrument by symbol."""
-    query = select(Instrument).where(Instrument.symbol == symbol)
+    stmt = lambda_stmt(lambda: select(Instrument).where(Instrument.symbol == symbol))
     if market:
-        query = query.where(Instrument.market == market)
+        stmt += lambda s: s.where(Instrument.market == market)
 
-    result = await session.execute(query)
+    result = await session.execute(stmt)
     instrument = result.scalar_one_or_none()
 
     if not instrument:
@@ -95,12 +161,12 @@ async def get_instrument(
             detail=f"Instrument '{symbol}' not found",
         )
 
-    return InstrumentResponse(
-        id=str(instrument.id),
+    return InstrumentResponse.model_construct(
+        id=instrument.id,
         symbol=instrument.symbol,
         name=instrument.name,
-        market=instrument.market.value,
-        type=instrument.type.value,
+        market=instrument.market,
+        type=instrument.type,
         exchange=instrument.exchange,
         currency=instrument.currency,
         is_active=instrument.is_active,
@@ -116,28 +182,36 @@ async def get_instrument_signals(
     limit: int = Query(20, ge=1, le=100),
 ):
     """Get signals related to an instrument."""
-    from src.infra.database.models import Signal
-
-    result = await session.execute(
-        select(Signal)
+    stmt = lambda_stmt(
+        lambda: select(Signal, func.count().over())
         .where(Signal.symbol == symbol)
         .order_by(Signal.created_at.desc())
-        .offset(skip)
-        .limit(limit)
     )
-    signals = list(result.scalars().all())
+    stmt += lambda s: s.offset(skip).limit(limit)
+
+    result = await session.execute(stmt)
+    rows = result.all()
+    signals = [row[0] for row in rows]
+    if rows:
+        total = rows[0][1]
+    elif skip == 0:
+        total = 0
+    else:
+        total = await session.scalar(
+            select(func.count()).select_from(Signal).where(Signal.symbol == symbol)
+        )
 
-    return {
+    return ORJSONResponse({
         "items": [
             {
-                "id": str(s.id),
+                "id": s.id,
                 "strategy_id": s.strategy_id,
-                "side": s.side.value,
-                "confidence": float(s.confidence),
+                "side": s.side,
+                "confidence": s.confidence,
                 "reason_points": s.reason_points,
-                "created_at": s.created_at.isoformat(),
+                "created_at": s.created_at,
             }
             for s in signals
         ],
-        "total": len(signals),
-    }
+        "total": total,
+    })
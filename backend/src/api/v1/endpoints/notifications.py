@@ -1,5 +1,6 @@
 """Notification endpoints."""
 
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
@@ -7,6 +8,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
 from src.api.deps import get_current_user, get_notification_service
+from src.core.json_response import ORJSONResponse
 from src.services.notification_service import NotificationService
 from src.domain.entities.user import UserEntity
 
@@ -14,13 +16,13 @@ router = APIRouter(prefix="/notifications")
 
 
 class NotificationResponse(BaseModel):
-    id: str
+    id: UUID
     type: str
     title: str
     content: str | None
     link: str | None
     is_read: bool
-    created_at: str
+    created_at: datetime
 
 
 class NotificationsListResponse(BaseModel):
@@ -29,7 +31,11 @@ class NotificationsListResponse(BaseModel):
     unread_count: int
 
 
-@router.get("", response_model=NotificationsListResponse)
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": NotificationsListResponse}},
+)
 async def list_notifications(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
     notification_service: Annotated[NotificationService, Depends(get_notification_service)],
@@ -38,31 +44,31 @@ async def list_notifications(
     limit: int = Query(20, ge=1, le=100),
 ):
     """List user's notifications."""
-    notifications = await notification_service.get_user_notifications(
-        user_id=current_user.id,
-        unread_only=unread_only,
-        skip=skip,
-        limit=limit,
+    notifications, total, unread_count = (
+        await notification_service.get_user_notifications_page(
+            user_id=current_user.id,
+            unread_only=unread_only,
+            skip=skip,
+            limit=limit,
+        )
     )
 
-    unread_count = await notification_service.get_unread_count(current_user.id)
-
-    return NotificationsListResponse(
-        items=[
-            NotificationResponse(
-                id=str(n.id),
-                type=n.type.value,
-                title=n.title,
-                content=n.content,
-                link=n.link,
-                is_read=n.is_read,
-                created_at=n.created_at.isoformat(),
-            )
+    return ORJSONResponse({
+        "items": [
+            {
+                "id": n.id,
+                "type": n.type,
+                "title": n.title,
+                "content": n.content,
+                "link": n.link,
+                "is_read": n.is_read,
+                "created_at": n.created_at,
+            }
             for n in notifications
         ],
-        total=len(notifications),
-        unread_count=unread_count,
-    )
+        "total": total,
+        "unread_count": unread_count,
+    })
 
 
 @router.post("/{notification_id}/read")
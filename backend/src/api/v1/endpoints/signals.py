@@ -5,17 +5,19 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from src.api.deps import get_current_user, get_signal_service
+from src.core.json_response import ORJSONResponse
 from src.services.signal_service import SignalService
+from src.domain.entities.signal import SignalEntity
 from src.domain.entities.user import UserEntity
 
 router = APIRouter(prefix="/signals")
 
 
 class SignalResponse(BaseModel):
-    id: str
+    id: UUID | None
     strategy_id: str
     strategy_version: str
     symbol: str
@@ -25,7 +27,7 @@ class SignalResponse(BaseModel):
     reason_points: list[str]
     risk_tags: list[str]
     snapshot: dict
-    created_at: str | None
+    created_at: datetime | None
 
 
 class SignalDetailResponse(SignalResponse):
@@ -38,23 +40,33 @@ class SignalsListResponse(BaseModel):
     has_more: bool
 
 
-def to_response(entity) -> SignalResponse:
-    return SignalResponse(
-        id=str(entity.id) if entity.id else "",
+# Validates and serializes a whole page in one pydantic-core call
+_SIGNAL_LIST_ADAPTER = TypeAdapter(list[SignalResponse])
+
+
+def to_response(entity: SignalEntity) -> SignalResponse:
+    # Entities always carry Market/SignalSide enums and already-typed
+    # fields, so validation is skipped.
+    return SignalResponse.model_construct(
+        id=entity.id,
         strategy_id=entity.strategy_id,
         strategy_version=entity.strategy_version,
         symbol=entity.symbol,
-        market=entity.market.value if hasattr(entity.market, 'value') else entity.market,
-        side=entity.side.value if hasattr(entity.side, 'value') else entity.side,
+        market=entity.market,
+        side=entity.side,
         confidence=entity.confidence,
         reason_points=entity.reason_points,
         risk_tags=entity.risk_tags,
         snapshot=entity.snapshot,
-        created_at=entity.created_at.isoformat() if entity.created_at else None,
+        created_at=entity.created_at,
     )
 
 
-@router.get("", response_model=SignalsListResponse)
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": SignalsListResponse}},
+)
 async def list_signals(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
     signal_service: Annotated[SignalService, Depends(get_signal_service)],
@@ -76,11 +88,13 @@ async def list_signals(
         limit=limit,
     )
 
-    return SignalsListResponse(
-        items=[to_response(s) for s in result.items],
-        next_cursor=result.next_cursor,
-        has_more=result.has_more,
-    )
+    items = _SIGNAL_LIST_ADAPTER.validate_python(result.items, from_attributes=True)
+
+    return ORJSONResponse({
+        "items": _SIGNAL_LIST_ADAPTER.dump_python(items, mode="json"),
+        "next_cursor": result.next_cursor,
+        "has_more": result.has_more,
+    })
 
 
 @router.get("/{signal_id}", response_model=SignalDetailResponse)
@@ -93,7 +107,7 @@ async def get_signal_detail(
     detail = await signal_service.get_signal_detail(signal_id, current_user.id)
 
     return SignalDetailResponse(
-        id=str(detail.get("id", "")),
+        id=detail.get("id"),
         strategy_id=detail.get("strategy_id", ""),
         strategy_version=detail.get("strategy_version", ""),
         symbol=detail.get("symbol", ""),
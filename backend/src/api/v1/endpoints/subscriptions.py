@@ -1,13 +1,16 @@
 """Subscription endpoints."""
 
+from datetime import datetime
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from src.api.deps import get_current_user, get_subscription_service
+from src.core.json_response import ORJSONResponse
 from src.services.subscription_service import SubscriptionService
+from src.domain.entities.subscription import SubscriptionEntity
 from src.domain.entities.user import UserEntity
 
 router = APIRouter(prefix="/subscriptions")
@@ -27,15 +30,15 @@ class UpdateSubscriptionRequest(BaseModel):
 
 
 class SubscriptionResponse(BaseModel):
-    id: str
+    id: UUID
     strategy_id: str
     params: dict
     channels: list[str]
     cooldown_seconds: int
     status: str
-    last_signal_at: str | None
+    last_signal_at: datetime | None
     signal_count: int
-    created_at: str | None
+    created_at: datetime | None
 
 
 class SubscriptionsListResponse(BaseModel):
@@ -43,21 +46,30 @@ class SubscriptionsListResponse(BaseModel):
     total: int
 
 
-def to_response(entity) -> SubscriptionResponse:
-    return SubscriptionResponse(
-        id=str(entity.id),
+# Validates and serializes a whole page in one pydantic-core call
+_SUBSCRIPTION_LIST_ADAPTER = TypeAdapter(list[SubscriptionResponse])
+
+
+def to_response(entity: SubscriptionEntity) -> SubscriptionResponse:
+    # Fields come from our own domain entity, so skip revalidation
+    return SubscriptionResponse.model_construct(
+        id=entity.id,
         strategy_id=entity.strategy_id,
         params=entity.params,
         channels=entity.channels,
         cooldown_seconds=entity.cooldown_seconds,
-        status=entity.status.value,
-        last_signal_at=entity.last_signal_at.isoformat() if entity.last_signal_at else None,
+        status=entity.status,
+        last_signal_at=entity.last_signal_at,
         signal_count=entity.signal_count,
-        created_at=entity.created_at.isoformat() if entity.created_at else None,
+        created_at=entity.created_at,
     )
 
 
-@router.get("", response_model=SubscriptionsListResponse)
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": SubscriptionsListResponse}},
+)
 async def list_subscriptions(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
     subscription_service: Annotated[SubscriptionService, Depends(get_subscription_service)],
@@ -66,17 +78,19 @@ async def list_subscriptions(
     limit: int = Query(20, ge=1, le=100),
 ):
     """List user's subscriptions."""
-    subs = await subscription_service.get_user_subscriptions(
+    subs, total = await subscription_service.get_user_subscriptions(
         user_id=current_user.id,
         active_only=active_only,
         skip=skip,
         limit=limit,
     )
 
-    return SubscriptionsListResponse(
-        items=[to_response(s) for s in subs],
-        total=len(subs),
-    )
+    items = _SUBSCRIPTION_LIST_ADAPTER.validate_python(subs, from_attributes=True)
+
+    return ORJSONResponse({
+        "items": _SUBSCRIPTION_LIST_ADAPTER.dump_python(items, mode="json"),
+        "total": total,
+    })
 
 
 @router.post("", response_model=SubscriptionResponse)
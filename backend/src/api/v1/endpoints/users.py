@@ -1,9 +1,11 @@
 """User endpoints."""
 
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from src.api.deps import get_current_user, get_user_service
 from src.services.user_service import UserService
@@ -13,15 +15,17 @@ router = APIRouter(prefix="/users")
 
 
 class UserResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     email: str
     nickname: str | None
     avatar_url: str | None
     role: str
     tier: str
-    tier_expires_at: str | None
+    tier_expires_at: datetime | None
     is_active: bool
-    created_at: str | None
+    created_at: datetime | None
 
 
 class UpdateProfileRequest(BaseModel):
@@ -40,17 +44,7 @@ async def get_current_user_info(
     current_user: Annotated[UserEntity, Depends(get_current_user)],
 ):
     """Get current user information."""
-    return UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        nickname=current_user.nickname,
-        avatar_url=current_user.avatar_url,
-        role=current_user.role.value,
-        tier=current_user.tier.value,
-        tier_expires_at=current_user.tier_expires_at.isoformat() if current_user.tier_expires_at else None,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at.isoformat() if current_user.created_at else None,
-    )
+    return UserResponse.model_validate(current_user)
 
 
 @router.patch("/me", response_model=UserResponse)
@@ -67,17 +61,7 @@ async def update_profile(
         phone=request.phone,
     )
 
-    return UserResponse(
-        id=str(updated.id),
-        email=updated.email,
-        nickname=updated.nickname,
-        avatar_url=updated.avatar_url,
-        role=updated.role.value,
-        tier=updated.tier.value,
-        tier_expires_at=updated.tier_expires_at.isoformat() if updated.tier_expires_at else None,
-        is_active=updated.is_active,
-        created_at=updated.created_at.isoformat() if updated.created_at else None,
-    )
+    return UserResponse.model_validate(updated)
 
 
 @router.post("/me/change-password")
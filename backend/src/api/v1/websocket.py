@@ -1,14 +1,15 @@
 """WebSocket endpoint for real-time updates."""
 
 import asyncio
-import json
-from typing import Dict, Set
+from array import array
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
 from fastapi.websockets import WebSocketState
 
 from src.core.security import verify_access_token
+from src.domain.entities.signal import SignalEntity
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -16,69 +17,196 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+# Per-send timeout; a client that cannot take a frame in time is dropped
+SEND_TIMEOUT = 5.0
+# Messages buffered per connection before further ones are dropped
+SEND_QUEUE_SIZE = 1000
+# Window over which market updates for the same key are collapsed
+COALESCE_INTERVAL_MS = 50
+
+
+def _encode(message: dict) -> str:
+    # Serialized once per fan-out. Sent as a text frame because the browser
+    # client JSON.parse()s event.data, which a binary frame makes a Blob.
+    return orjson.dumps(message).decode()
+
+
+# Static control frames, encoded once at import
+_WELCOME = _encode({"type": "connected", "message": "Connected to SignalFlow"})
+_PONG = _encode({"type": "pong"})
+_ERR_INVALID_JSON = _encode({"type": "error", "message": "Invalid JSON"})
+
+
 class ConnectionManager:
-    """Manage WebSocket connections."""
+    """Manage WebSocket connections.
+
+    Each connection has a bounded outbound queue drained by its own writer
+    task, so fan-out is a non-blocking enqueue per socket and a slow client
+    only ever backs up its own queue. ``self._lock`` only guards the
+    registry and is never held across a send.
+
+    Connections live in parallel per-slot lists indexed by an integer slot
+    id, with vacated slots reused from a free list. ``_by_user`` maps each
+    user to the slot ids of their connections.
+    """
 
     def __init__(self):
-        # user_id -> set of websockets
-        self._connections: Dict[str, Set[WebSocket]] = {}
+        self._ws: list[WebSocket | None] = []
+        self._queues: list[asyncio.Queue[str] | None] = []
+        self._writers: list[asyncio.Task[None] | None] = []
+        self._free: list[int] = []
+        self._by_user: dict[str, array] = {}
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket, user_id: str) -> None:
         await websocket.accept()
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
         async with self._lock:
-            if user_id not in self._connections:
-                self._connections[user_id] = set()
-            self._connections[user_id].add(websocket)
+            writer = asyncio.create_task(self._writer(websocket, user_id, queue))
+            if self._free:
+                slot = self._free.pop()
+                self._ws[slot] = websocket
+                self._queues[slot] = queue
+                self._writers[slot] = writer
+            else:
+                slot = len(self._ws)
+                self._ws.append(websocket)
+                self._queues.append(queue)
+                self._writers.append(writer)
+            self._by_user.setdefault(user_id, array("i")).append(slot)
         logger.info("WebSocket connected", user_id=user_id)
 
     async def disconnect(self, websocket: WebSocket, user_id: str) -> None:
         async with self._lock:
-            if user_id in self._connections:
-                self._connections[user_id].discard(websocket)
-                if not self._connections[user_id]:
-                    del self._connections[user_id]
+            writer = self._unregister(websocket, user_id)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info("WebSocket disconnected", user_id=user_id)
 
+    def _unregister(self, websocket: WebSocket, user_id: str) -> asyncio.Task[None] | None:
+        """Free a socket's slot; caller holds the lock."""
+        slots = self._by_user.get(user_id)
+        if slots is None:
+            return None
+        for slot in slots:
+            if self._ws[slot] is websocket:
+                break
+        else:
+            return None
+
+        slots.remove(slot)
+        if not slots:
+            del self._by_user[user_id]
+        writer = self._writers[slot]
+        self._ws[slot] = self._queues[slot] = self._writers[slot] = None
+        self._free.append(slot)
+        return writer
+
+    async def _writer(self, websocket: WebSocket, user_id: str, queue: asyncio.Queue[str]) -> None:
+        """Drain one connection's queue until the socket fails."""
+        try:
+            while True:
+                payload = await queue.get()
+                if websocket.client_state != WebSocketState.CONNECTED:
+                    break
+                await asyncio.wait_for(websocket.send_text(payload), SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Failed to send WebSocket message", error=str(e))
+
+        async with self._lock:
+            self._unregister(websocket, user_id)
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), SEND_TIMEOUT)
+        except Exception:
+            pass
+
+    def _fan_out(self, queues: list[asyncio.Queue[str]], payload: str) -> None:
+        """Enqueue a payload on each connection without awaiting."""
+        for queue in queues:
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                logger.warning("WebSocket send queue full, dropping message")
+
     async def send_to_user(self, user_id: str, message: dict) -> None:
         """Send message to all connections of a user."""
         async with self._lock:
-            connections = self._connections.get(user_id, set()).copy()
+            queues = [self._queues[slot] for slot in self._by_user.get(user_id, ())]
 
-        for websocket in connections:
-            try:
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_json(message)
-            except Exception as e:
-                logger.error("Failed to send WebSocket message", error=str(e))
+        if queues:
+            self._fan_out(queues, _encode(message))
 
     async def broadcast(self, message: dict) -> None:
         """Broadcast message to all connected users."""
         async with self._lock:
-            all_connections = [
-                ws for conns in self._connections.values() for ws in conns
-            ]
+            queues = [q for q in self._queues if q is not None]
 
-        for websocket in all_connections:
-            try:
-                if websocket.client_state == WebSocketState.CONNECTED:
-                    await websocket.send_json(message)
-            except Exception as e:
-                logger.error("Failed to broadcast WebSocket message", error=str(e))
+        if queues:
+            self._fan_out(queues, _encode(message))
 
     def get_connection_count(self) -> int:
         """Get total number of connections."""
-        return sum(len(conns) for conns in self._connections.values())
+        return len(self._ws) - len(self._free)
 
     def get_user_count(self) -> int:
         """Get number of connected users."""
-        return len(self._connections)
+        return len(self._by_user)
 
 
 # Global connection manager
 manager = ConnectionManager()
 
 
+class CoalescingBroadcaster:
+    """Collapse bursts of broadcasts down to the latest payload per key.
+
+    Updates are held for ``interval`` seconds; only the newest payload for
+    each market symbol is sent when the window closes. Payloads without a
+    symbol have nothing to coalesce on and are all sent, in order. The
+    flush task exits once a window passes with no updates, so an idle feed
+    costs nothing.
+    """
+
+    def __init__(
+        self,
+        manager: ConnectionManager,
+        message_type: str,
+        interval: float = COALESCE_INTERVAL_MS / 1000,
+    ):
+        self._manager = manager
+        self._message_type = message_type
+        self._interval = interval
+        self._latest: dict[str, dict] = {}
+        self._unkeyed: list[dict] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def submit(self, data: dict) -> None:
+        """Record the latest payload for its symbol and schedule a flush."""
+        symbol = data.get("symbol")
+        if symbol is None:
+            self._unkeyed.append(data)
+        else:
+            self._latest[symbol] = data
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._latest or self._unkeyed:
+            await asyncio.sleep(self._interval)
+            unkeyed, self._unkeyed = self._unkeyed, []
+            latest, self._latest = self._latest, {}
+            for data in (*unkeyed, *latest.values()):
+                await self._manager.broadcast({
+                    "type": self._message_type,
+                    "data": data,
+                })
+
+
+market_updates = CoalescingBroadcaster(manager, "market_update")
+
+
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
@@ -107,34 +235,27 @@ async def websocket_endpoint(websocket: WebSocket):
         await manager.connect(websocket, user_id)
 
         # Send welcome message
-        await websocket.send_json({
-            "type": "connected",
-            "message": "Connected to SignalFlow",
-        })
+        await websocket.send_text(_WELCOME)
 
         # Keep connection alive and handle messages
         while True:
             try:
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = orjson.loads(data)
 
                 # Handle ping
                 if message.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await websocket.send_text(_PONG)
 
                 # Handle subscription to specific channels
                 elif message.get("type") == "subscribe":
                     channel = message.get("channel")
-                    await websocket.send_json({
-                        "type": "subscribed",
-                        "channel": channel,
-                    })
-
-            except json.JSONDecodeError:
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Invalid JSON",
-                })
+                    await websocket.send_text(
+                        _encode({"type": "subscribed", "channel": channel})
+                    )
+
+            except orjson.JSONDecodeError:
+                await websocket.send_text(_ERR_INVALID_JSON)
 
     except WebSocketDisconnect:
         if user_id:
@@ -145,8 +266,11 @@ async def websocket_endpoint(websocket: WebSocket):
             await manager.disconnect(websocket, user_id)
 
 
-async def notify_user_signal(user_id: str, signal_data: dict) -> None:
-    """Send signal notification to a user."""
+async def notify_user_signal(user_id: str, signal_data: dict | SignalEntity) -> None:
+    """Send signal notification to a user.
+
+    A SignalEntity can be passed as is; orjson encodes it in place.
+    """
     await manager.send_to_user(user_id, {
         "type": "signal",
         "data": signal_data,
@@ -162,8 +286,9 @@ async def notify_user_notification(user_id: str, notification_data: dict) -> Non
 
 
 async def broadcast_market_update(data: dict) -> None:
-    """Broadcast market update to all users."""
-    await manager.broadcast({
-        "type": "market_update",
-        "data": data,
-    })
+    """Broadcast market update to all users.
+
+    Bursts are coalesced so each symbol is sent at most once per
+    COALESCE_INTERVAL_MS, however fast the upstream ticks arrive.
+    """
+    market_updates.submit(data)
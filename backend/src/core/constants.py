@@ -114,6 +114,13 @@ SUBSCRIPTION_LIMITS = {
     UserTier.ENTERPRISE: 500,
 }
 
+# Tier ranks for "at least this tier" checks
+TIER_LEVELS = {
+    UserTier.FREE: 0,
+    UserTier.PRO: 1,
+    UserTier.ENTERPRISE: 2,
+}
+
 # Default cooldown periods (in seconds)
 DEFAULT_COOLDOWN = 3600  # 1 hour
 
@@ -1,6 +1,6 @@
 """Custom exceptions for the application."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 
 class SignalFlowError(Exception):
@@ -56,48 +56,49 @@ class PermissionDeniedError(AuthorizationError):
 
 # Resource errors
 class NotFoundError(SignalFlowError):
-    """Resource not found."""
+    """Resource not found.
 
-    def __init__(self, resource: str, identifier: str | None = None):
-        message = f"{resource} not found"
+    Subclasses name the resource once in ``resource`` and are raised with
+    just the identifier.
+    """
+
+    resource: ClassVar[str] = "Resource"
+
+    def __init__(self, identifier: str | None = None):
         if identifier:
-            message = f"{resource} with id '{identifier}' not found"
-        super().__init__(message)
+            super().__init__(f"{self.resource} with id '{identifier}' not found")
+        else:
+            super().__init__(f"{self.resource} not found")
 
 
 class StrategyNotFoundError(NotFoundError):
     """Strategy not found."""
 
-    def __init__(self, strategy_id: str):
-        super().__init__("Strategy", strategy_id)
+    resource = "Strategy"
 
 
 class SubscriptionNotFoundError(NotFoundError):
     """Subscription not found."""
 
-    def __init__(self, subscription_id: str):
-        super().__init__("Subscription", subscription_id)
+    resource = "Subscription"
 
 
 class SignalNotFoundError(NotFoundError):
     """Signal not found."""
 
-    def __init__(self, signal_id: str):
-        super().__init__("Signal", signal_id)
+    resource = "Signal"
 
 
 class UserNotFoundError(NotFoundError):
     """User not found."""
 
-    def __init__(self, user_id: str):
-        super().__init__("User", user_id)
+    resource = "User"
 
 
 class InstrumentNotFoundError(NotFoundError):
     """Instrument not found."""
 
-    def __init__(self, symbol: str):
-        super().__init__("Instrument", symbol)
+    resource = "Instrument"
 
 
 # Validation errors
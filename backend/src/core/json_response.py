@@ -0,0 +1,20 @@
+"""orjson-backed JSON response class."""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder."""
+
+    media_type = "application/json"
+
+    # UUID and datetime are encoded natively, exactly as str() and
+    # isoformat() would write them; no zone is added or rewritten, so these
+    # payloads match the ones serialized elsewhere.
+    option = orjson.OPT_NON_STR_KEYS
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.option)
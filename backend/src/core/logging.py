@@ -1,13 +1,28 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+import orjson
 import structlog
 
+# Background listener that owns the real output handlers
+_listener: QueueListener | None = None
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+
+def _orjson_dumps(obj: Any, default: Any = None, **kwargs: Any) -> str:
+    """Serialize a log event with orjson.
+
+    Stdlib loggers expect ``str`` messages, so the bytes are decoded here.
+    """
+    return orjson.dumps(obj, default=default).decode()
+
+
+def get_logger(name: str | None = None) -> structlog.typing.FilteringBoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
 
@@ -15,40 +30,65 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
 def configure_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     """Configure structured logging for the application."""
 
-    # Set up standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
+    global _listener
+
+    # Set up standard library logging. Records are handed to a queue and
+    # written to stdout by a listener thread, keeping I/O off the request path.
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(log_queue)]
+    level = getattr(logging, log_level.upper())
+    root_logger.setLevel(level)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
 
     # Shared processors for all environments
     shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
     ]
 
     if log_format == "json":
-        # JSON format for production
+        # JSON format for production. Callers log with kwargs only and
+        # str is already unicode, so the positional-args, stack-info and
+        # unicode-decode processors are left out of the per-call path.
         processors = shared_processors + [
+            structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
     else:
         # Console format for development
         processors = shared_processors + [
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
             structlog.dev.ConsoleRenderer(colors=True),
         ]
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below the configured level are no-ops bound at configure
+        # time instead of running the processor chain first
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread on exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
@@ -1,5 +1,11 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -9,17 +15,103 @@ from passlib.context import CryptContext
 from src.core.config import settings
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
+
+# bcrypt releases the GIL, so hashing on a dedicated pool runs in parallel
+# across cores without stalling the event loop
+HASH_EXEC = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="pwhash")
+
+# LRU of bcrypt verification results, keyed by a keyed digest of
+# (hash, password) so no plaintext is kept in memory. A result for a given
+# hash/password pair never changes, so entries need no expiry.
+_VERIFY_CACHE_SIZE = 10_000
+_verify_cache: OrderedDict[bytes, bool] = OrderedDict()
+_verify_cache_key = hashlib.sha256(settings.secret_key.encode()).digest()
+
+
+def _verify_key(plain_password: str, hashed_password: str) -> bytes:
+    return hashlib.blake2b(
+        f"{hashed_password}:{plain_password}".encode(),
+        key=_verify_cache_key,
+        digest_size=16,
+    ).digest()
+
+
+def _cached_verification(key: bytes) -> bool | None:
+    """Return a remembered result, marking it recently used, or None."""
+    cached = _verify_cache.get(key)
+    if cached is not None:
+        _verify_cache.move_to_end(key)
+    return cached
+
+
+def _remember_verification(key: bytes, result: bool) -> None:
+    _verify_cache[key] = result
+    if len(_verify_cache) > _VERIFY_CACHE_SIZE:
+        _verify_cache.popitem(last=False)
+
+
+# JWT settings resolved once at import; they are read on every request
+_JWT_SECRET = settings.jwt_secret_key
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.jwt_access_token_expire_minutes)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.jwt_refresh_token_expire_days)
+
+# Short-lived LRU of decoded access tokens, so reconnects and parallel
+# requests carrying the same token skip signature verification. Entries
+# never outlive the token's own exp claim, and callers get their own copy
+# of the payload.
+_TOKEN_CACHE_SIZE = 10_000
+_TOKEN_CACHE_TTL = 30.0
+_token_cache: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    hashed = pwd_context.hash(password)
+    # Seed the cache so a login right after registration skips bcrypt
+    _remember_verification(_verify_key(password, hashed), True)
+    return hashed
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    key = _verify_key(plain_password, hashed_password)
+    cached = _cached_verification(key)
+    if cached is not None:
+        return cached
+
+    result = pwd_context.verify(plain_password, hashed_password)
+    _remember_verification(key, result)
+    return result
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the hashing thread pool."""
+    hashed = await asyncio.get_running_loop().run_in_executor(
+        HASH_EXEC, pwd_context.hash, password
+    )
+    _remember_verification(_verify_key(password, hashed), True)
+    return hashed
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing thread pool."""
+    key = _verify_key(plain_password, hashed_password)
+    cached = _cached_verification(key)
+    if cached is not None:
+        return cached
+
+    result = await asyncio.get_running_loop().run_in_executor(
+        HASH_EXEC, pwd_context.verify, plain_password, hashed_password
+    )
+    _remember_verification(key, result)
+    return result
 
 
 def create_access_token(
@@ -29,15 +121,10 @@ def create_access_token(
     """Create a JWT access token."""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
+    expire = datetime.now(timezone.utc) + (expires_delta or _ACCESS_TOKEN_TTL)
 
     to_encode.update({"exp": expire, "type": "access"})
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def create_refresh_token(
@@ -47,13 +134,10 @@ def create_refresh_token(
     """Create a JWT refresh token."""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=settings.jwt_refresh_token_expire_days)
+    expire = datetime.now(timezone.utc) + (expires_delta or _REFRESH_TOKEN_TTL)
 
     to_encode.update({"exp": expire, "type": "refresh"})
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return jwt.encode(to_encode, _JWT_SECRET, algorithm=_JWT_ALGORITHM)
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
@@ -61,8 +145,8 @@ def decode_token(token: str) -> dict[str, Any] | None:
     try:
         payload = jwt.decode(
             token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+            _JWT_SECRET,
+            algorithms=_JWT_ALGORITHMS,
         )
         return payload
     except JWTError:
@@ -71,8 +155,24 @@ def decode_token(token: str) -> dict[str, Any] | None:
 
 def verify_access_token(token: str) -> dict[str, Any] | None:
     """Verify an access token and return its payload."""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _token_cache.move_to_end(key)
+            return dict(cached[1])
+        del _token_cache[key]
+
     payload = decode_token(token)
     if payload and payload.get("type") == "access":
+        expires_at = now + _TOKEN_CACHE_TTL
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        _token_cache[key] = (expires_at, dict(payload))
+        if len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
         return payload
     return None
 
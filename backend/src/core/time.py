@@ -0,0 +1,29 @@
+"""Clock helpers.
+
+All wall-clock reads go through here so the timezone policy lives in one
+place. Timestamps are naive UTC, matching the database columns.
+"""
+
+import time
+from datetime import UTC, datetime
+from functools import lru_cache
+
+
+def utcnow() -> datetime:
+    """Naive UTC now; replaces the deprecated ``datetime.utcnow()``."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=1)
+def _utcnow_cached(ttl_hash: int) -> datetime:
+    return utcnow()
+
+
+def coarse_utcnow() -> datetime:
+    """Naive UTC now, shared by all calls within the same 100 ms tick.
+
+    For bookkeeping timestamps (``updated_at``, event timestamps) where
+    fanning one signal out to many subscriptions would otherwise read the
+    clock once per subscription.
+    """
+    return _utcnow_cached(int(time.monotonic() * 10))
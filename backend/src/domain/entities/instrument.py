@@ -5,6 +5,8 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
+
 from src.core.constants import Market, InstrumentType
 
 
@@ -34,17 +36,22 @@ class InstrumentEntity:
         """Check if instrument is tradable."""
         return self.is_active
 
+    def to_json(self) -> bytes:
+        """Serialize every field straight to JSON bytes, without an intermediate dict."""
+        return orjson.dumps(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
             "id": str(self.id),
             "symbol": self.symbol,
             "name": self.name,
-            "market": self.market.value,
-            "type": self.type.value,
+            "market": self.market,
+            "type": self.type,
             "exchange": self.exchange,
             "currency": self.currency,
             "metadata": self.metadata,
             "is_active": self.is_active,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -5,8 +5,14 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
+
 from src.core.constants import SignalSide, Market
 
+# Direct value -> member lookups for from_dict, skipping Enum.__call__
+_MARKET_BY_VALUE = Market._value2member_map_
+_SIDE_BY_VALUE = SignalSide._value2member_map_
+
 
 @dataclass
 class SignalEntity:
@@ -46,6 +52,10 @@ class SignalEntity:
         if tag not in self.risk_tags:
             self.risk_tags.append(tag)
 
+    def to_json(self) -> bytes:
+        """Serialize every field straight to JSON bytes, without an intermediate dict."""
+        return orjson.dumps(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -53,8 +63,8 @@ class SignalEntity:
             "strategy_id": self.strategy_id,
             "strategy_version": self.strategy_version,
             "symbol": self.symbol,
-            "market": self.market.value,
-            "side": self.side.value,
+            "market": self.market,
+            "side": self.side,
             "confidence": self.confidence,
             "reason_points": self.reason_points,
             "risk_tags": self.risk_tags,
@@ -72,8 +82,8 @@ class SignalEntity:
             strategy_id=data["strategy_id"],
             strategy_version=data["strategy_version"],
             symbol=data["symbol"],
-            market=Market(data["market"]),
-            side=SignalSide(data["side"]),
+            market=_MARKET_BY_VALUE[data["market"]],
+            side=_SIDE_BY_VALUE[data["side"]],
             confidence=data["confidence"],
             reason_points=data["reason_points"],
             risk_tags=data.get("risk_tags", []),
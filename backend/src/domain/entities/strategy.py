@@ -1,11 +1,64 @@
 """Strategy entity."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from src.core.constants import StrategyType, RiskLevel, UserTier
 
+ParamsValidator = Callable[[dict[str, Any]], list[str]]
+
+# Compiled validators per (strategy id, version, updated_at); entities are
+# rebuilt per request, so the cache lives at module level
+_PARAM_VALIDATORS_SIZE = 256
+_param_validators: dict[tuple[Any, ...], ParamsValidator] = {}
+
+
+def _compile_params_schema(schema: dict[str, Any]) -> ParamsValidator:
+    """Resolve a params schema once into a validator closure."""
+    required = tuple(schema.get("required", []))
+    # name -> (type, minimum, maximum)
+    checks = {
+        name: (prop.get("type"), prop.get("minimum"), prop.get("maximum"))
+        for name, prop in schema.get("properties", {}).items()
+    }
+
+    def validate(params: dict[str, Any]) -> list[str]:
+        errors = [
+            f"Missing required parameter: {param}"
+            for param in required
+            if param not in params
+        ]
+
+        for param_name, param_value in params.items():
+            check = checks.get(param_name)
+            if check is None:
+                continue
+            prop_type, min_val, max_val = check
+
+            # Type validation
+            if prop_type == "number":
+                if not isinstance(param_value, (int, float)):
+                    errors.append(f"Parameter '{param_name}' must be a number")
+                    continue
+
+                # Range validation for numbers
+                if min_val is not None and param_value < min_val:
+                    errors.append(f"Parameter '{param_name}' must be >= {min_val}")
+
+                if max_val is not None and param_value > max_val:
+                    errors.append(f"Parameter '{param_name}' must be <= {max_val}")
+
+            elif prop_type == "string" and not isinstance(param_value, str):
+                errors.append(f"Parameter '{param_name}' must be a string")
+
+        return errors
+
+    return validate
+
 
 @dataclass
 class StrategyEntity:
@@ -34,44 +87,14 @@ class StrategyEntity:
         Validate user params against schema.
         Returns (is_valid, error_messages).
         """
-        errors = []
-        schema = self.params_schema
-
-        # Check required params
-        required = schema.get("required", [])
-        for param in required:
-            if param not in params:
-                errors.append(f"Missing required parameter: {param}")
-
-        # Check param types and constraints
-        properties = schema.get("properties", {})
-        for param_name, param_value in params.items():
-            if param_name not in properties:
-                continue
-
-            prop_schema = properties[param_name]
-            prop_type = prop_schema.get("type")
-
-            # Type validation
-            if prop_type == "number" and not isinstance(param_value, (int, float)):
-                errors.append(f"Parameter '{param_name}' must be a number")
-                continue
-
-            if prop_type == "string" and not isinstance(param_value, str):
-                errors.append(f"Parameter '{param_name}' must be a string")
-                continue
-
-            # Range validation for numbers
-            if prop_type == "number":
-                min_val = prop_schema.get("minimum")
-                max_val = prop_schema.get("maximum")
-
-                if min_val is not None and param_value < min_val:
-                    errors.append(f"Parameter '{param_name}' must be >= {min_val}")
-
-                if max_val is not None and param_value > max_val:
-                    errors.append(f"Parameter '{param_name}' must be <= {max_val}")
-
+        key = (self.id, self.version, self.updated_at)
+        validator = _param_validators.get(key)
+        if validator is None:
+            if len(_param_validators) >= _PARAM_VALIDATORS_SIZE:
+                _param_validators.clear()
+            validator = _param_validators[key] = _compile_params_schema(self.params_schema)
+
+        errors = validator(params)
         return len(errors) == 0, errors
 
     def merge_params(self, user_params: dict[str, Any]) -> dict[str, Any]:
@@ -80,6 +103,10 @@ class StrategyEntity:
         result.update(user_params)
         return result
 
+    def to_json(self) -> bytes:
+        """Serialize every field straight to JSON bytes, without an intermediate dict."""
+        return orjson.dumps(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -87,9 +114,9 @@ class StrategyEntity:
             "version": self.version,
             "name": self.name,
             "description": self.description,
-            "type": self.type.value,
+            "type": self.type,
             "markets": self.markets,
-            "risk_level": self.risk_level.value if self.risk_level else None,
+            "risk_level": self.risk_level,
             "frequency_hint": self.frequency_hint,
             "params_schema": self.params_schema,
             "default_params": self.default_params,
@@ -97,6 +124,7 @@ class StrategyEntity:
             "metrics_summary": self.metrics_summary,
             "is_active": self.is_active,
             "is_public": self.is_public,
-            "tier_required": self.tier_required.value,
+            "tier_required": self.tier_required,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -5,10 +5,13 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
+import orjson
+
 from src.core.constants import SubscriptionStatus, DeliveryChannel
+from src.core.time import coarse_utcnow
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionEntity:
     """Subscription domain entity."""
 
@@ -40,7 +43,7 @@ class SubscriptionEntity:
             return True
 
         if now is None:
-            now = datetime.utcnow()
+            now = coarse_utcnow()
 
         elapsed = (now - self.last_signal_at).total_seconds()
         return elapsed >= self.cooldown_seconds
@@ -48,23 +51,28 @@ class SubscriptionEntity:
     def pause(self) -> None:
         """Pause the subscription."""
         self.status = SubscriptionStatus.PAUSED
-        self.updated_at = datetime.utcnow()
+        self.updated_at = coarse_utcnow()
 
     def resume(self) -> None:
         """Resume the subscription."""
         self.status = SubscriptionStatus.ACTIVE
-        self.updated_at = datetime.utcnow()
+        self.updated_at = coarse_utcnow()
 
     def cancel(self) -> None:
         """Cancel the subscription."""
         self.status = SubscriptionStatus.CANCELLED
-        self.updated_at = datetime.utcnow()
+        self.updated_at = coarse_utcnow()
 
     def record_signal(self, signal_time: datetime | None = None) -> None:
         """Record that a signal was sent."""
-        self.last_signal_at = signal_time or datetime.utcnow()
+        now = coarse_utcnow()
+        self.last_signal_at = signal_time or now
         self.signal_count += 1
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
+
+    def to_json(self) -> bytes:
+        """Serialize every field straight to JSON bytes, without an intermediate dict."""
+        return orjson.dumps(self)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -75,8 +83,9 @@ class SubscriptionEntity:
             "params": self.params,
             "channels": self.channels,
             "cooldown_seconds": self.cooldown_seconds,
-            "status": self.status.value,
+            "status": self.status,
             "last_signal_at": self.last_signal_at.isoformat() if self.last_signal_at else None,
             "signal_count": self.signal_count,
             "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
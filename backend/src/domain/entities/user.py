@@ -5,10 +5,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from src.core.constants import UserRole, UserTier, SUBSCRIPTION_LIMITS
+from src.core.constants import UserRole, UserTier, SUBSCRIPTION_LIMITS, TIER_LEVELS
 
+_PRO_TIERS = frozenset({UserTier.PRO, UserTier.ENTERPRISE})
 
-@dataclass
+
+@dataclass(slots=True)
 class UserEntity:
     """User domain entity."""
 
@@ -35,7 +37,7 @@ class UserEntity:
     @property
     def is_pro(self) -> bool:
         """Check if user has Pro tier or higher."""
-        return self.tier in (UserTier.PRO, UserTier.ENTERPRISE)
+        return self.tier in _PRO_TIERS
 
     @property
     def is_admin(self) -> bool:
@@ -44,10 +46,7 @@ class UserEntity:
 
     def can_subscribe_to_strategy(self, tier_required: UserTier) -> bool:
         """Check if user can subscribe to a strategy based on tier."""
-        tier_order = [UserTier.FREE, UserTier.PRO, UserTier.ENTERPRISE]
-        user_tier_index = tier_order.index(self.tier)
-        required_tier_index = tier_order.index(tier_required)
-        return user_tier_index >= required_tier_index
+        return TIER_LEVELS[self.tier] >= TIER_LEVELS[tier_required]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary (excluding sensitive data)."""
@@ -56,8 +55,8 @@ class UserEntity:
             "email": self.email,
             "nickname": self.nickname,
             "avatar_url": self.avatar_url,
-            "role": self.role.value,
-            "tier": self.tier.value,
+            "role": self.role,
+            "tier": self.tier,
             "tier_expires_at": self.tier_expires_at.isoformat() if self.tier_expires_at else None,
             "is_active": self.is_active,
             "created_at": self.created_at.isoformat() if self.created_at else None,
@@ -5,30 +5,47 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
+import orjson
 
-@dataclass
+from src.core.time import coarse_utcnow
+
+
+@dataclass(slots=True)
 class DomainEvent:
     """Base class for domain events."""
 
     event_id: UUID = field(default_factory=uuid4)
-    event_type: str = ""
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    event_type: str = "DomainEvent"
+    timestamp: datetime = field(default_factory=coarse_utcnow)
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self) -> None:
-        if not self.event_type:
-            self.event_type = self.__class__.__name__
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Default event_type to the class name at declaration time rather
+        # than patching it on every instance. Declaring it as an own field
+        # lets the dataclass decorator pick the default up. (Explicit super
+        # form: slots=True rebuilds the class, breaking the zero-arg cell.)
+        super(DomainEvent, cls).__init_subclass__(**kwargs)
+        if "event_type" not in cls.__dict__.get("__annotations__", {}):
+            cls.__annotations__ = {**cls.__dict__.get("__annotations__", {}), "event_type": str}
+            cls.event_type = cls.__name__  # type: ignore[misc]
+
+    def to_json(self) -> bytes:
+        """Serialize every field straight to JSON bytes, without an intermediate dict.
+
+        ``to_dict`` keys match field names on every event, so this carries the
+        same content with the encoding done in orjson's C code.
+        """
+        return orjson.dumps(self)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert event to dictionary."""
+        """Convert event to dictionary.
+
+        Subclasses override this with the base keys and their own fields in
+        a single literal, rather than merging a separate payload dict.
+        """
         return {
             "event_id": str(self.event_id),
             "event_type": self.event_type,
             "timestamp": self.timestamp.isoformat(),
             "metadata": self.metadata,
-            **self._payload(),
         }
-
-    def _payload(self) -> dict[str, Any]:
-        """Override to add event-specific payload."""
-        return {}
@@ -6,7 +6,7 @@ from typing import Any
 from src.domain.events.base import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class DataUpdatedEvent(DomainEvent):
     """Event fired when market data is updated."""
 
@@ -16,8 +16,12 @@ class DataUpdatedEvent(DomainEvent):
     symbols: list[str] = field(default_factory=list)
     record_count: int = 0
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "provider_id": self.provider_id,
             "capability": self.capability,
             "symbols": self.symbols,
@@ -25,7 +29,7 @@ class DataUpdatedEvent(DomainEvent):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderHealthChangedEvent(DomainEvent):
     """Event fired when a provider's health status changes."""
 
@@ -34,8 +38,12 @@ class ProviderHealthChangedEvent(DomainEvent):
     is_healthy: bool = True
     error_message: str | None = None
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "provider_id": self.provider_id,
             "is_healthy": self.is_healthy,
             "error_message": self.error_message,
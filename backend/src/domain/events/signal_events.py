@@ -8,7 +8,7 @@ from src.domain.events.base import DomainEvent
 from src.core.constants import SignalSide, SubscriptionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalCreatedEvent(DomainEvent):
     """Event fired when a new signal is created."""
 
@@ -20,18 +20,22 @@ class SignalCreatedEvent(DomainEvent):
     side: SignalSide = SignalSide.OBSERVE
     confidence: float = 0.0
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "signal_id": str(self.signal_id) if self.signal_id else None,
             "strategy_id": self.strategy_id,
             "symbol": self.symbol,
             "market": self.market,
-            "side": self.side.value,
+            "side": self.side,
             "confidence": self.confidence,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionCreatedEvent(DomainEvent):
     """Event fired when a new subscription is created."""
 
@@ -40,15 +44,19 @@ class SubscriptionCreatedEvent(DomainEvent):
     user_id: UUID | None = None
     strategy_id: str = ""
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "subscription_id": str(self.subscription_id) if self.subscription_id else None,
             "user_id": str(self.user_id) if self.user_id else None,
             "strategy_id": self.strategy_id,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SubscriptionUpdatedEvent(DomainEvent):
     """Event fired when a subscription is updated."""
 
@@ -59,17 +67,21 @@ class SubscriptionUpdatedEvent(DomainEvent):
     old_status: SubscriptionStatus | None = None
     new_status: SubscriptionStatus | None = None
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "subscription_id": str(self.subscription_id) if self.subscription_id else None,
             "user_id": str(self.user_id) if self.user_id else None,
             "strategy_id": self.strategy_id,
-            "old_status": self.old_status.value if self.old_status else None,
-            "new_status": self.new_status.value if self.new_status else None,
+            "old_status": self.old_status,
+            "new_status": self.new_status,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalDeliveredEvent(DomainEvent):
     """Event fired when a signal is delivered to a user."""
 
@@ -81,8 +93,12 @@ class SignalDeliveredEvent(DomainEvent):
     success: bool = True
     error_message: str | None = None
 
-    def _payload(self) -> dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         return {
+            "event_id": str(self.event_id),
+            "event_type": self.event_type,
+            "timestamp": self.timestamp.isoformat(),
+            "metadata": self.metadata,
             "signal_id": str(self.signal_id) if self.signal_id else None,
             "user_id": str(self.user_id) if self.user_id else None,
             "subscription_id": str(self.subscription_id) if self.subscription_id else None,
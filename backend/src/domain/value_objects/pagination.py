@@ -1,13 +1,28 @@
 """Pagination value objects."""
 
-import base64
-import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar
 
+import orjson
+
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=1024)
+def _decode_cursor(cursor: str) -> Mapping[str, Any] | None:
+    try:
+        # Restore the padding stripped by encode_cursor
+        padded = cursor + "=" * (-len(cursor) % 4)
+        # Read-only view, since the same object is handed to every caller
+        return MappingProxyType(orjson.loads(urlsafe_b64decode(padded)))
+    except Exception:
+        return None
+
+
 @dataclass
 class CursorPagination:
     """Cursor-based pagination parameters."""
@@ -15,21 +30,23 @@ class CursorPagination:
     cursor: str | None = None
     limit: int = 20
 
-    def decode_cursor(self) -> dict[str, Any] | None:
-        """Decode cursor string to dictionary."""
+    def decode_cursor(self) -> Mapping[str, Any] | None:
+        """Decode cursor string to a read-only mapping.
+
+        Decoded payloads are cached by cursor string, so repeated decodes of
+        the same page token skip the base64 and JSON work.
+        """
         if not self.cursor:
             return None
-        try:
-            decoded = base64.b64decode(self.cursor).decode("utf-8")
-            return json.loads(decoded)
-        except Exception:
-            return None
+        return _decode_cursor(self.cursor)
 
     @staticmethod
     def encode_cursor(data: dict[str, Any]) -> str:
-        """Encode dictionary to cursor string."""
-        json_str = json.dumps(data, default=str)
-        return base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+        """Encode dictionary to a URL-safe, unpadded cursor string.
+
+        UUID and datetime values are serialized natively by orjson.
+        """
+        return urlsafe_b64encode(orjson.dumps(data)).rstrip(b"=").decode("ascii")
 
 
 @dataclass
@@ -44,13 +61,52 @@ class PagedResult(Generic[T]):
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         result: dict[str, Any] = {
-            "items": [
-                item.to_dict() if hasattr(item, "to_dict") else item
-                for item in self.items
-            ],
+            "items": self._items_to_dicts(),
             "next_cursor": self.next_cursor,
             "has_more": self.has_more,
         }
         if self.total is not None:
             result["total"] = self.total
         return result
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize the page straight to JSON bytes.
+
+        When every item is a dataclass with its own ``to_json`` (the
+        entities and events), orjson encodes the items list in a single
+        pass, dumping every dataclass field, and no intermediate dicts are
+        built. Those types' ``to_dict`` covers all of their fields, so the
+        bytes decode to ``to_dict()``. Other pages go through ``to_dict``,
+        which also keeps types whose ``to_dict`` omits fields (UserEntity)
+        from being dumped whole.
+        """
+        items = self.items
+        types = set(map(type, items))
+        if len(types) != 1 or not hasattr(types.pop(), "to_json"):
+            return orjson.dumps(self.to_dict())
+
+        result: dict[str, Any] = {
+            "items": items,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+        }
+        if self.total is not None:
+            result["total"] = self.total
+        return orjson.dumps(result)
+
+    def _items_to_dicts(self) -> list[Any]:
+        items = self.items
+        if not items:
+            return []
+        # Pages are homogeneous in practice: resolve to_dict once on the
+        # class and map it, instead of probing every item
+        types = set(map(type, items))
+        if len(types) == 1:
+            to_dict = getattr(types.pop(), "to_dict", None)
+            if to_dict is None:
+                return list(items)
+            return list(map(to_dict, items))
+        return [
+            item.to_dict() if hasattr(item, "to_dict") else item
+            for item in items
+        ]
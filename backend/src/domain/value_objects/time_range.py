@@ -2,8 +2,11 @@
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Any
 
+from src.core.time import utcnow
+
 
 @dataclass(frozen=True)
 class TimeRange:
@@ -21,9 +24,12 @@ class TimeRange:
         """Get duration of the time range."""
         return self.end - self.start
 
-    @property
+    @cached_property
     def duration_seconds(self) -> float:
-        """Get duration in seconds."""
+        """Get duration in seconds.
+
+        The range is frozen, so the timedelta is built once per instance.
+        """
         return self.duration.total_seconds()
 
     def contains(self, dt: datetime) -> bool:
@@ -37,21 +43,21 @@ class TimeRange:
     @classmethod
     def last_n_days(cls, days: int) -> "TimeRange":
         """Create a time range for the last N days."""
-        end = datetime.utcnow()
+        end = utcnow()
         start = end - timedelta(days=days)
         return cls(start=start, end=end)
 
     @classmethod
     def last_n_hours(cls, hours: int) -> "TimeRange":
         """Create a time range for the last N hours."""
-        end = datetime.utcnow()
+        end = utcnow()
         start = end - timedelta(hours=hours)
         return cls(start=start, end=end)
 
     @classmethod
     def today(cls) -> "TimeRange":
         """Create a time range for today."""
-        now = datetime.utcnow()
+        now = utcnow()
         start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end = now
         return cls(start=start, end=end)
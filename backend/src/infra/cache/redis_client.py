@@ -1,8 +1,11 @@
 """Redis client for caching."""
 
-import json
+import asyncio
+import time
+from fnmatch import fnmatchcase
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from src.core.config import settings
@@ -10,6 +13,16 @@ from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keys scanned and unlinked per round-trip in delete_pattern
+DELETE_BATCH_SIZE = 500
+
+# In-process L1 cache for hot, rarely-changing keys (see get_json_l1)
+LOCAL_TTL_DEFAULT = 30.0
+LOCAL_MAX_SIZE = 1024
+# Writes made with invalidate=True publish their key (or delete pattern)
+# here so every process drops its L1 copy
+INVALIDATE_CHANNEL = "cache:invalidate"
+
 
 class RedisClient:
     """Async Redis client wrapper."""
@@ -17,14 +30,25 @@ class RedisClient:
     def __init__(self, url: str | None = None):
         self._url = url or settings.redis_url
         self._client: redis.Redis | None = None
+        # key -> (expires_at on the monotonic clock, raw JSON)
+        self._local: dict[str, tuple[float, str]] = {}
+        # Bumped on every L1 eviction so an in-flight fill can tell that it
+        # raced an invalidation
+        self._local_generation = 0
+        self._invalidation_task: asyncio.Task[None] | None = None
 
     async def connect(self) -> None:
         """Connect to Redis."""
         self._client = redis.from_url(self._url, decode_responses=True)
+        self._invalidation_task = asyncio.create_task(self._listen_invalidations())
         logger.info("Connected to Redis")
 
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
+        if self._invalidation_task:
+            self._invalidation_task.cancel()
+            self._invalidation_task = None
+        self._local.clear()
         if self._client:
             await self._client.close()
             logger.info("Disconnected from Redis")
@@ -43,39 +67,156 @@ class RedisClient:
         """Get and deserialize JSON value."""
         value = await self.get(key)
         if value:
-            return json.loads(value)
+            return orjson.loads(value)
         return None
 
+    async def get_json_l1(
+        self,
+        key: str,
+        local_ttl: float | None = None,
+    ) -> Any | None:
+        """Get a JSON value through the in-process L1 cache.
+
+        For hot keys that change rarely (tier features, price info). A hit
+        skips the Redis round-trip; writers of such keys pass
+        ``invalidate=True`` to evict them in every process via
+        INVALIDATE_CHANNEL, and ``local_ttl`` bounds staleness if an
+        invalidation is missed. The raw JSON is cached, so every call
+        returns a fresh object the caller may mutate.
+        """
+        now = time.monotonic()
+        entry = self._local.get(key)
+        if entry is not None and entry[0] > now:
+            return orjson.loads(entry[1])
+
+        generation = self._local_generation
+        raw = await self.get(key)
+        if not raw:
+            return None
+        # An eviction during the read may mean raw is already stale
+        if generation == self._local_generation:
+            if len(self._local) >= LOCAL_MAX_SIZE:
+                # Drop the oldest insertion
+                del self._local[next(iter(self._local))]
+            self._local[key] = (now + (local_ttl or LOCAL_TTL_DEFAULT), raw)
+        return orjson.loads(raw)
+
+    async def mget_json(self, keys: list[str]) -> list[Any | None]:
+        """Get and deserialize several JSON values in one round-trip."""
+        if not keys:
+            return []
+        values = await self.client.mget(keys)
+        return [orjson.loads(value) if value else None for value in values]
+
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         expire: int | None = None,
+        invalidate: bool = False,
     ) -> None:
-        """Set a value with optional expiration (seconds)."""
-        await self.client.set(key, value, ex=expire)
+        """Set a value with optional expiration (seconds).
+
+        Pass ``invalidate=True`` for keys read through get_json_l1.
+        """
+        self._drop_local(key)
+        if not invalidate:
+            await self.client.set(key, value, ex=expire)
+            return
+        async with self.pipeline() as pipe:
+            pipe.set(key, value, ex=expire)
+            pipe.publish(INVALIDATE_CHANNEL, key)
+            await pipe.execute()
 
     async def set_json(
         self,
         key: str,
         value: Any,
         expire: int | None = None,
+        invalidate: bool = False,
     ) -> None:
         """Serialize and set JSON value."""
-        await self.set(key, json.dumps(value, default=str), expire)
+        await self.set(key, orjson.dumps(value, default=str), expire, invalidate)
 
-    async def delete(self, key: str) -> None:
+    async def mset_json(
+        self,
+        items: dict[str, Any],
+        expire: int | None = None,
+        invalidate: bool = False,
+    ) -> None:
+        """Serialize and set several JSON values in one round-trip."""
+        if not items:
+            return
+        async with self.pipeline() as pipe:
+            for key, value in items.items():
+                self._drop_local(key)
+                pipe.set(key, orjson.dumps(value, default=str), ex=expire)
+                if invalidate:
+                    pipe.publish(INVALIDATE_CHANNEL, key)
+            await pipe.execute()
+
+    def pipeline(self, transaction: bool = False) -> redis.client.Pipeline:
+        """Start a pipeline for batching commands into one round-trip.
+
+        Use as ``async with client.pipeline() as pipe: ...; await pipe.execute()``.
+        """
+        return self.client.pipeline(transaction=transaction)
+
+    async def delete(self, key: str, invalidate: bool = False) -> None:
         """Delete a key."""
-        await self.client.delete(key)
-
-    async def delete_pattern(self, pattern: str) -> int:
-        """Delete all keys matching a pattern."""
-        keys = []
-        async for key in self.client.scan_iter(match=pattern):
-            keys.append(key)
-        if keys:
-            return await self.client.delete(*keys)
-        return 0
+        self._drop_local(key)
+        if not invalidate:
+            await self.client.delete(key)
+            return
+        async with self.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.publish(INVALIDATE_CHANNEL, key)
+            await pipe.execute()
+
+    async def delete_pattern(self, pattern: str, invalidate: bool = False) -> int:
+        """Delete all keys matching a pattern.
+
+        Keys are unlinked in batches as the scan yields them, so memory
+        stays bounded and Redis frees the values off its main thread.
+        """
+        count = 0
+        batch: list[str] = []
+        async for key in self.client.scan_iter(match=pattern, count=DELETE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= DELETE_BATCH_SIZE:
+                count += await self.client.unlink(*batch)
+                batch.clear()
+        if batch:
+            count += await self.client.unlink(*batch)
+        self._drop_local(pattern)
+        if invalidate:
+            await self.client.publish(INVALIDATE_CHANNEL, pattern)
+        return count
+
+    def _drop_local(self, key_or_pattern: str) -> None:
+        """Evict a key, or every key matching a glob pattern, from L1."""
+        self._local_generation += 1
+        if any(c in key_or_pattern for c in "*?["):
+            for key in [k for k in self._local if fnmatchcase(k, key_or_pattern)]:
+                del self._local[key]
+        else:
+            self._local.pop(key_or_pattern, None)
+
+    async def _listen_invalidations(self) -> None:
+        """Evict L1 entries written or deleted by any process."""
+        pubsub = self.client.pubsub()
+        try:
+            await pubsub.subscribe(INVALIDATE_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._drop_local(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Entries still expire after their local TTL
+            logger.error("L1 cache invalidation listener stopped", error=str(e))
+        finally:
+            await pubsub.aclose()
 
     async def exists(self, key: str) -> bool:
         """Check if a key exists."""
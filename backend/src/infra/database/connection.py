@@ -2,19 +2,34 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+_connect_args: dict[str, Any] = {
+    # Repeated queries reuse their server-side prepared statement and
+    # plan instead of a parse/plan per execute
+    "prepared_statement_cache_size": settings.database_statement_cache_size,
+    "statement_cache_size": settings.database_statement_cache_size,
+    # Short OLTP queries never amortize JIT compilation
+    "server_settings": {"jit": "off"},
+}
+if settings.database_statement_cache_size == 0:
+    # pgbouncer transaction pooling: the dialect still prepares named
+    # statements, so make the names unique or another client's statement
+    # on the same server connection collides with ours
+    _connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
@@ -22,13 +37,10 @@ engine = create_async_engine(
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
     pool_pre_ping=True,
-)
-
-# For testing, use NullPool
-test_engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    poolclass=NullPool,
+    query_cache_size=settings.database_query_cache_size,
+    # Rows per multi-VALUES INSERT when bulk_create batches executemany
+    insertmanyvalues_page_size=1000,
+    connect_args=_connect_args,
 )
 
 # Session factory
@@ -42,7 +54,10 @@ AsyncSessionLocal = async_sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting database session."""
+    """Dependency for getting database session.
+
+    Leaving the ``async with`` closes the session, so no explicit close.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -50,22 +65,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
-@asynccontextmanager
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Context manager for getting database session."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+# Context manager for getting database session outside of DI (workers)
+get_session = asynccontextmanager(get_db)
 
 
 async def init_db() -> None:
@@ -5,22 +5,27 @@ from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
-    ARRAY,
     Boolean,
+    Computed,
     DateTime,
+    Double,
     Enum,
     ForeignKey,
     Index,
     Integer,
-    Numeric,
+    LargeBinary,
+    SmallInteger,
     String,
     Text,
+    event,
     func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, validates
 
 from src.core.constants import (
+    TIER_LEVELS,
     DeliveryChannel,
     DeliveryStatus,
     InstrumentType,
@@ -34,6 +39,10 @@ from src.core.constants import (
     UserTier,
 )
 
+# Generated expression for signals.dedup_hash (migration 018). MD5 only
+# buckets keys; nothing relies on it being collision resistant.
+DEDUP_HASH_SQL = "decode(md5(dedup_key), 'hex')"
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -106,6 +115,13 @@ class Instrument(Base, TimestampMixin):
     __tablename__ = "instruments"
     __table_args__ = (
         Index("idx_instruments_market_type", "market", "type"),
+        Index("idx_instruments_created_id", "created_at", "id"),
+        # Trigram index backing the list_instruments "q" substring search
+        Index(
+            "idx_instruments_search_trgm",
+            text("(symbol || ' ' || name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -130,6 +146,28 @@ class Strategy(Base, TimestampMixin):
     """Strategy model."""
 
     __tablename__ = "strategies"
+    __table_args__ = (
+        # get_by_tier: tier_level <= :level over the listable strategies
+        Index(
+            "idx_strategies_public_tier_level",
+            "tier_level",
+            postgresql_where=text("is_active AND is_public"),
+        ),
+        # Listing queries only ever look at active, public strategies
+        Index(
+            "idx_strategies_active_partial",
+            "type",
+            postgresql_where=text("is_active AND is_public"),
+        ),
+        # Default array opclass; serves markets @> ARRAY[...] in get_by_market
+        Index("idx_strategies_markets_gin", "markets", postgresql_using="gin"),
+        Index(
+            "idx_strategies_metrics_gin",
+            "metrics_summary",
+            postgresql_using="gin",
+            postgresql_ops={"metrics_summary": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(50), primary_key=True)
     version: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -147,18 +185,26 @@ class Strategy(Base, TimestampMixin):
     default_params: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
     default_cooldown: Mapped[int] = mapped_column(Integer, default=3600)
     metrics_summary: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
     tier_required: Mapped[UserTier] = mapped_column(
         Enum(UserTier, name="user_tier", create_type=False),
         default=UserTier.FREE,
     )
+    # TIER_LEVELS[tier_required], kept in sync by _sync_tier_level
+    tier_level: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
 
     # Relationships
     subscriptions: Mapped[list["Subscription"]] = relationship(back_populates="strategy")
     signals: Mapped[list["Signal"]] = relationship(back_populates="strategy")
 
 
+@event.listens_for(Strategy.tier_required, "set")
+def _sync_tier_level(target: Strategy, value: UserTier, oldvalue: Any, initiator: Any) -> None:
+    """Keep the integer tier rank in step with the tier enum."""
+    target.tier_level = TIER_LEVELS[value]
+
+
 class Subscription(Base, TimestampMixin):
     """Subscription model."""
 
@@ -167,6 +213,19 @@ class Subscription(Base, TimestampMixin):
         Index("idx_subscriptions_user", "user_id"),
         Index("idx_subscriptions_strategy", "strategy_id"),
         Index("idx_subscriptions_status", "status"),
+        # Eligibility check over active subscriptions only; enum label is lowercase
+        Index(
+            "idx_subscriptions_eligible",
+            "strategy_id",
+            "last_signal_at",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "idx_subscriptions_params_gin",
+            "params",
+            postgresql_using="gin",
+            postgresql_ops={"params": "jsonb_path_ops"},
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -206,8 +265,39 @@ class Signal(Base):
     __table_args__ = (
         Index("idx_signals_strategy", "strategy_id"),
         Index("idx_signals_symbol", "symbol"),
-        Index("idx_signals_created", "created_at"),
-        Index("idx_signals_dedup", "dedup_key", "created_at"),
+        # Matches the feed order and the (created_at, id) keyset cursor; the
+        # INCLUDEd filter columns are checked in the index, so only matching
+        # rows cost a heap fetch
+        Index(
+            "idx_signals_feed_covering",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["strategy_id", "symbol", "market", "side"],
+        ),
+        # 16-byte fixed keys instead of up to 200-char strings
+        Index("idx_signals_dedup_hash", "dedup_hash", "created_at"),
+        # jsonb_path_ops: smaller and faster than the default opclass, and
+        # only @> containment is ever asked of these columns
+        Index(
+            "idx_signals_snapshot_gin",
+            "snapshot",
+            postgresql_using="gin",
+            postgresql_ops={"snapshot": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_signals_reason_points_gin",
+            "reason_points",
+            postgresql_using="gin",
+            postgresql_ops={"reason_points": "jsonb_path_ops"},
+        ),
+        # Monthly partitions signals_YYYYMM (migration 011) plus a DEFAULT
+        # partition (migration 019); the primary key must include the
+        # partition key. signal_explains and delivery_plans have no foreign
+        # key to signals, so nothing cascades: SignalRepository.delete removes
+        # them, and retiring a month means DETACH PARTITION signals_YYYYMM,
+        # then DELETE FROM signal_explains / delivery_plans WHERE signal_id IN
+        # (SELECT id FROM signals_YYYYMM), then dropping the detached table.
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -227,25 +317,41 @@ class Signal(Base):
         Enum(SignalSide, name="signal_side"),
         nullable=False,
     )
-    confidence: Mapped[float] = mapped_column(Numeric(3, 2), nullable=False)
-    reason_points: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    # Native float8: read straight into a Python float, no Decimal per row
+    confidence: Mapped[float] = mapped_column(Double, nullable=False)
+    # Always a JSON array; see _normalize_reason_points
+    reason_points: Mapped[list[str]] = mapped_column(JSONB, nullable=False)
     risk_tags: Mapped[list[str]] = mapped_column(ARRAY(String), default=list)
     snapshot: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
     dedup_key: Mapped[str | None] = mapped_column(String(200))
+    # 16-byte digest of dedup_key, generated by the database so every insert
+    # path (ORM, Core, bulk, raw SQL) gets it
+    dedup_hash: Mapped[bytes | None] = mapped_column(
+        LargeBinary(16),
+        Computed(DEDUP_HASH_SQL, persisted=True),
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         server_default=func.now(),
-        nullable=False,
     )
 
     # Relationships
     strategy: Mapped["Strategy"] = relationship(back_populates="signals")
     explain: Mapped["SignalExplain | None"] = relationship(
         back_populates="signal",
+        primaryjoin="Signal.id == foreign(SignalExplain.signal_id)",
         uselist=False,
         cascade="all, delete-orphan",
     )
 
+    @validates("reason_points")
+    def _normalize_reason_points(self, key: str, value: Any) -> list[str]:
+        """Store the legacy {"points": [...]} shape as a plain list."""
+        if isinstance(value, dict):
+            return value.get("points", [])
+        return value
+
 
 class SignalExplain(Base):
     """Signal AI explanation model."""
@@ -257,9 +363,9 @@ class SignalExplain(Base):
         primary_key=True,
         default=uuid.uuid4,
     )
+    # No foreign key: signals is partitioned and its key is (id, created_at)
     signal_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("signals.id", ondelete="CASCADE"),
         unique=True,
         nullable=False,
     )
@@ -273,7 +379,10 @@ class SignalExplain(Base):
     )
 
     # Relationships
-    signal: Mapped["Signal"] = relationship(back_populates="explain")
+    signal: Mapped["Signal"] = relationship(
+        back_populates="explain",
+        primaryjoin="Signal.id == foreign(SignalExplain.signal_id)",
+    )
 
 
 class DeliveryPlan(Base):
@@ -281,9 +390,13 @@ class DeliveryPlan(Base):
 
     __tablename__ = "delivery_plans"
     __table_args__ = (
-        Index("idx_delivery_status", "status"),
         Index("idx_delivery_user", "user_id"),
-        Index("idx_delivery_scheduled", "scheduled_at"),
+        # The dispatcher only ever scans pending plans; enum label is lowercase
+        Index(
+            "idx_delivery_pending",
+            "scheduled_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -291,11 +404,8 @@ class DeliveryPlan(Base):
         primary_key=True,
         default=uuid.uuid4,
     )
-    signal_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("signals.id"),
-        nullable=False,
-    )
+    # No foreign key: signals is partitioned and its key is (id, created_at)
+    signal_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     subscription_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("subscriptions.id"),
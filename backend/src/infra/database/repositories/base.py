@@ -1,37 +1,62 @@
 """Base repository with common CRUD operations."""
 
+from collections.abc import Sequence
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select, func, delete
+from sqlalchemy import Select, bindparam, select, func, delete, exists, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.infra.database.models import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# Rows fetched per round trip when streaming through a server-side cursor
+STREAM_BATCH_SIZE = 500
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
 
     model: type[ModelType]
 
+    # Statements built once per concrete repository in __init_subclass__;
+    # the hot paths only bind parameters and hit the compiled cache
+    _get_by_id_stmt: Select[Any]
+    _exists_stmt: Select[Any]
+    _count_stmt: Select[Any]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("model")
+        if model is None:
+            return
+        cls._get_by_id_stmt = (
+            select(model).options(raiseload("*")).where(model.id == bindparam("id"))
+        )
+        cls._exists_stmt = select(exists().where(model.id == bindparam("id")))
+        cls._count_stmt = select(func.count()).select_from(model)
+
     def __init__(self, session: AsyncSession):
         self._session = session
 
     async def get_by_id(self, id: UUID | str) -> ModelType | None:
-        """Get a record by ID."""
-        result = await self._session.execute(
-            select(self.model).where(self.model.id == id)
-        )
+        """Get a record by ID.
+
+        Relationships are raiseload'ed here and in get_all: an implicit lazy
+        load cannot run under asyncio anyway, and this makes it fail loudly
+        at the access site. Load relations explicitly where needed.
+        """
+        result = await self._session.execute(self._get_by_id_stmt, {"id": id})
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
+    async def get_all(self, skip: int = 0, limit: int = 100) -> Sequence[ModelType]:
         """Get all records with pagination."""
         result = await self._session.execute(
-            select(self.model).offset(skip).limit(limit)
+            select(self.model).options(raiseload("*")).offset(skip).limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def create(self, obj: ModelType) -> ModelType:
         """Create a new record."""
@@ -40,6 +65,21 @@ class BaseRepository(Generic[ModelType]):
         await self._session.refresh(obj)
         return obj
 
+    async def bulk_create(self, rows: list[dict[str, Any]]) -> list[Any]:
+        """Insert many records in one statement and return their IDs.
+
+        Executed as an executemany INSERT ... RETURNING, which SQLAlchemy
+        batches with insertmanyvalues instead of a flush and refresh per
+        object. Column defaults (ids, timestamps) are still applied.
+        """
+        if not rows:
+            return []
+        result = await self._session.execute(
+            insert(self.model).returning(self.model.id),
+            rows,
+        )
+        return list(result.scalars())
+
     async def update(self, obj: ModelType) -> ModelType:
         """Update an existing record."""
         await self._session.flush()
@@ -55,14 +95,11 @@ class BaseRepository(Generic[ModelType]):
 
     async def count(self) -> int:
         """Count all records."""
-        result = await self._session.execute(
-            select(func.count()).select_from(self.model)
-        )
+        result = await self._session.execute(self._count_stmt)
         return result.scalar_one()
 
     async def exists(self, id: UUID | str) -> bool:
         """Check if a record exists."""
-        result = await self._session.execute(
-            select(func.count()).select_from(self.model).where(self.model.id == id)
-        )
-        return result.scalar_one() > 0
+        # EXISTS stops at the first match instead of aggregating a count
+        result = await self._session.execute(self._exists_stmt, {"id": id})
+        return bool(result.scalar_one())
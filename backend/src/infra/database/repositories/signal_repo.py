@@ -1,16 +1,45 @@
 """Signal repository."""
 
-from datetime import datetime
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import DateTime, cast, delete, select, func, and_, or_, column, exists, lambda_stmt, table, true, tuple_
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
-from src.infra.database.models import Signal, SignalExplain
-from src.infra.database.repositories.base import BaseRepository
+from src.infra.database.models import DeliveryPlan, Signal, SignalExplain, Strategy
+from src.infra.database.repositories.base import STREAM_BATCH_SIZE, BaseRepository
 from src.domain.entities.signal import SignalEntity
 from src.domain.value_objects.pagination import CursorPagination, PagedResult
 from src.core.constants import Market, SignalSide
+from src.core.time import utcnow
+
+
+# Per-strategy, per-UTC-day signal counts for completed days; refreshed by
+# the refresh_signal_counts beat task (migration 008)
+_DAILY_COUNTS = table(
+    "mv_signal_counts_daily",
+    column("strategy_id"),
+    column("day"),
+    column("cnt"),
+)
+
+# SignalEntity's positional fields, in declaration order up to dedup_key
+_entity_fields = attrgetter(
+    "strategy_id",
+    "strategy_version",
+    "symbol",
+    "market",
+    "side",
+    "confidence",
+    "reason_points",
+    "snapshot",
+    "id",
+    "risk_tags",
+    "dedup_key",
+)
 
 
 class SignalRepository(BaseRepository[Signal]):
@@ -18,37 +47,106 @@ class SignalRepository(BaseRepository[Signal]):
 
     model = Signal
 
+    async def delete(self, id: UUID | str) -> bool:
+        """Delete a signal together with its explanation and delivery plans.
+
+        signals is partitioned, so its children carry no foreign keys and
+        nothing cascades in the database; they are removed here first.
+        """
+        await self._session.execute(delete(SignalExplain).where(SignalExplain.signal_id == id))
+        await self._session.execute(delete(DeliveryPlan).where(DeliveryPlan.signal_id == id))
+        return await super().delete(id)
+
     async def get_by_strategy(
         self,
         strategy_id: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Signal]:
-        """Get signals for a strategy."""
-        result = await self._session.execute(
-            select(Signal)
+        verify_exists: bool = False,
+    ) -> Sequence[Signal] | None:
+        """Get signals for a strategy.
+
+        With ``verify_exists`` the strategy's existence is projected as a
+        column of the same query, and None is returned if it does not exist.
+        """
+        if not verify_exists:
+            stmt = lambda_stmt(
+                lambda: select(Signal)
+                .options(raiseload("*"))
+                .where(Signal.strategy_id == strategy_id)
+                .order_by(Signal.created_at.desc())
+            )
+            stmt += lambda s: s.offset(skip).limit(limit)
+
+            result = await self._session.execute(stmt)
+            return result.scalars().all()
+
+        strategy_exists = (
+            select(true()).where(Strategy.id == strategy_id).scalar_subquery()
+        )
+        stmt = lambda_stmt(
+            lambda: select(Signal, strategy_exists.label("strategy_exists"))
+            .options(raiseload("*"))
             .where(Signal.strategy_id == strategy_id)
             .order_by(Signal.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        return list(result.scalars().all())
+        stmt += lambda s: s.offset(skip).limit(limit)
+
+        rows = (await self._session.execute(stmt)).all()
+        if rows:
+            return [row[0] for row in rows] if rows[0][1] else None
+
+        # Empty page: existence still has to be answered on its own
+        found = await self._session.scalar(
+            select(exists().where(Strategy.id == strategy_id))
+        )
+        return [] if found else None
+
+    async def iter_by_strategy(
+        self,
+        strategy_id: str,
+        since: datetime | None = None,
+    ) -> AsyncIterator[Signal]:
+        """Stream all signals for a strategy, newest first.
+
+        Rows come from a server-side cursor in batches of
+        ``STREAM_BATCH_SIZE``, so memory stays bounded regardless of how
+        many signals the strategy has.
+        """
+        stmt = (
+            select(Signal)
+            .options(raiseload("*"))
+            .where(Signal.strategy_id == strategy_id)
+            .order_by(Signal.created_at.desc(), Signal.id.desc())
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        if since is not None:
+            stmt = stmt.where(Signal.created_at >= since)
+
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for partition in result.partitions():
+                for signal in partition:
+                    yield signal
+        finally:
+            await result.close()
 
     async def get_by_symbol(
         self,
         symbol: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Signal]:
+    ) -> Sequence[Signal]:
         """Get signals for a symbol."""
         result = await self._session.execute(
             select(Signal)
+            .options(raiseload("*"))
             .where(Signal.symbol == symbol)
             .order_by(Signal.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_with_filters(
         self,
@@ -61,7 +159,7 @@ class SignalRepository(BaseRepository[Signal]):
         pagination: CursorPagination | None = None,
     ) -> PagedResult[Signal]:
         """Get signals with filters and cursor pagination."""
-        query = select(Signal)
+        query = select(Signal).options(raiseload("*"))
 
         # Apply filters
         conditions = []
@@ -84,26 +182,24 @@ class SignalRepository(BaseRepository[Signal]):
         if end_time:
             conditions.append(Signal.created_at <= end_time)
 
-        if conditions:
-            query = query.where(and_(*conditions))
-
-        # Apply cursor pagination
+        # Apply cursor pagination: a row-value comparison that PostgreSQL
+        # turns into a range scan on idx_signals_feed_covering
         if pagination:
             cursor_data = pagination.decode_cursor()
             if cursor_data:
                 cursor_time = datetime.fromisoformat(cursor_data["created_at"])
                 cursor_id = UUID(cursor_data["id"])
-                query = query.where(
-                    and_(
-                        Signal.created_at <= cursor_time,
-                        Signal.id < cursor_id,
-                    ) | (Signal.created_at < cursor_time)
+                conditions.append(
+                    tuple_(Signal.created_at, Signal.id) < tuple_(cursor_time, cursor_id)
                 )
 
             limit = pagination.limit
         else:
             limit = 20
 
+        if conditions:
+            query = query.where(and_(*conditions))
+
         # Order by created_at desc, id desc
         query = query.order_by(Signal.created_at.desc(), Signal.id.desc())
 
@@ -111,7 +207,7 @@ class SignalRepository(BaseRepository[Signal]):
         query = query.limit(limit + 1)
 
         result = await self._session.execute(query)
-        signals = list(result.scalars().all())
+        signals = result.scalars().all()
 
         # Check if there are more results
         has_more = len(signals) > limit
@@ -123,8 +219,8 @@ class SignalRepository(BaseRepository[Signal]):
         if has_more and signals:
             last_signal = signals[-1]
             next_cursor = CursorPagination.encode_cursor({
-                "created_at": last_signal.created_at.isoformat(),
-                "id": str(last_signal.id),
+                "created_at": last_signal.created_at,
+                "id": last_signal.id,
             })
 
         return PagedResult(
@@ -139,15 +235,37 @@ class SignalRepository(BaseRepository[Signal]):
         since: datetime,
     ) -> Signal | None:
         """Get the most recent signal with the given dedup key since a time."""
+        # Same expression as the generated column; it folds to a constant,
+        # so idx_signals_dedup_hash is used
         result = await self._session.execute(
             select(Signal)
-            .where(Signal.dedup_key == dedup_key)
+            .where(Signal.dedup_hash == func.decode(func.md5(dedup_key), "hex"))
             .where(Signal.created_at >= since)
             .order_by(Signal.created_at.desc())
             .limit(1)
         )
         return result.scalar_one_or_none()
 
+    async def search_by_snapshot(
+        self,
+        contains: dict[str, Any],
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Sequence[Signal]:
+        """Get signals whose snapshot contains the given JSON object.
+
+        Emits ``snapshot @> :contains`` so idx_signals_snapshot_gin is used;
+        comparing ``snapshot['key'].astext`` values would not be.
+        """
+        result = await self._session.execute(
+            select(Signal)
+            .where(Signal.snapshot.contains(contains))
+            .order_by(Signal.created_at.desc(), Signal.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
     async def count_by_strategy_since(
         self,
         strategy_id: str,
@@ -162,22 +280,88 @@ class SignalRepository(BaseRepository[Signal]):
         )
         return result.scalar_one()
 
+    async def count_by_strategy_since_cached(
+        self,
+        strategy_id: str,
+        since: datetime,
+    ) -> int:
+        """Count signals for a strategy since a time, using the daily rollup.
+
+        Whole days in the window are summed from mv_signal_counts_daily;
+        only the partial first day and the days after the view's last
+        refresh are counted from signals. Same result as
+        count_by_strategy_since in one round-trip, with the live scan
+        bounded to at most a couple of days.
+        """
+        midnight = since.replace(hour=0, minute=0, second=0, microsecond=0)
+        first_full_day = midnight if midnight == since else midnight + timedelta(days=1)
+        if first_full_day >= utcnow():
+            return await self.count_by_strategy_since(strategy_id, since)
+
+        rolled_up = (
+            select(func.coalesce(func.sum(_DAILY_COUNTS.c.cnt), 0))
+            .where(_DAILY_COUNTS.c.strategy_id == strategy_id)
+            .where(_DAILY_COUNTS.c.day >= first_full_day.date())
+            .scalar_subquery()
+        )
+        # First day not yet in the view; greatest() ignores the NULL of an
+        # empty view. The view's days are UTC, so the boundary is made a UTC
+        # instant rather than left to the session TimeZone's date cast.
+        covered_until = cast(
+            func.greatest(
+                first_full_day.date(),
+                select(func.max(_DAILY_COUNTS.c.day) + 1).scalar_subquery(),
+            ),
+            DateTime,
+        ).op("AT TIME ZONE")("UTC")
+        live = (
+            select(func.count())
+            .select_from(Signal)
+            .where(Signal.strategy_id == strategy_id)
+            .where(Signal.created_at >= since)
+            .where(
+                or_(
+                    Signal.created_at < first_full_day,
+                    Signal.created_at >= covered_until,
+                )
+            )
+            .scalar_subquery()
+        )
+        result = await self._session.execute(select(rolled_up + live))
+        return int(result.scalar_one())
+
     async def get_with_explain(self, signal_id: UUID) -> tuple[Signal | None, SignalExplain | None]:
-        """Get signal with its AI explanation."""
-        signal_result = await self._session.execute(
-            select(Signal).where(Signal.id == signal_id)
+        """Get signal with its AI explanation.
+
+        The one-to-one explain row comes back through a LEFT OUTER JOIN in
+        the same statement; selectinload would still cost a second query.
+        """
+        result = await self._session.execute(
+            select(Signal)
+            .options(joinedload(Signal.explain))
+            .where(Signal.id == signal_id)
         )
-        signal = signal_result.scalar_one_or_none()
+        signal = result.scalar_one_or_none()
 
         if not signal:
             return None, None
 
-        explain_result = await self._session.execute(
-            select(SignalExplain).where(SignalExplain.signal_id == signal_id)
-        )
-        explain = explain_result.scalar_one_or_none()
+        return signal, signal.explain
 
-        return signal, explain
+    async def list_with_explains(self, signal_ids: list[UUID]) -> Sequence[Signal]:
+        """Get several signals with their explanations loaded.
+
+        selectinload fetches every explain in one IN () query, however many
+        signals are requested.
+        """
+        if not signal_ids:
+            return []
+        result = await self._session.execute(
+            select(Signal)
+            .options(selectinload(Signal.explain))
+            .where(Signal.id.in_(signal_ids))
+        )
+        return result.scalars().all()
 
     async def add_explain(
         self,
@@ -200,17 +384,9 @@ class SignalRepository(BaseRepository[Signal]):
 
     def to_entity(self, model: Signal) -> SignalEntity:
         """Convert model to entity."""
-        return SignalEntity(
-            id=model.id,
-            strategy_id=model.strategy_id,
-            strategy_version=model.strategy_version,
-            symbol=model.symbol,
-            market=model.market,
-            side=model.side,
-            confidence=float(model.confidence),
-            reason_points=model.reason_points if isinstance(model.reason_points, list) else model.reason_points.get("points", []),
-            risk_tags=model.risk_tags,
-            snapshot=model.snapshot,
-            dedup_key=model.dedup_key,
-            created_at=model.created_at,
-        )
+        return SignalEntity(*_entity_fields(model), created_at=model.created_at)
+
+    def to_entities(self, models: Sequence[Signal]) -> list[SignalEntity]:
+        """Convert a batch of models to entities."""
+        fields = _entity_fields
+        return [SignalEntity(*fields(m), created_at=m.created_at) for m in models]
@@ -1,11 +1,35 @@
 """Strategy repository."""
 
+from collections.abc import Sequence
+from operator import attrgetter
+
 from sqlalchemy import select, update
 
 from src.infra.database.models import Strategy
 from src.infra.database.repositories.base import BaseRepository
 from src.domain.entities.strategy import StrategyEntity
-from src.core.constants import StrategyType, UserTier
+from src.core.constants import StrategyType, UserTier, TIER_LEVELS
+
+# Every StrategyEntity field, in declaration order
+_entity_fields = attrgetter(
+    "id",
+    "version",
+    "name",
+    "type",
+    "params_schema",
+    "description",
+    "markets",
+    "risk_level",
+    "frequency_hint",
+    "default_params",
+    "default_cooldown",
+    "metrics_summary",
+    "is_active",
+    "is_public",
+    "tier_required",
+    "created_at",
+    "updated_at",
+)
 
 
 class StrategyRepository(BaseRepository[Strategy]):
@@ -17,7 +41,7 @@ class StrategyRepository(BaseRepository[Strategy]):
         self,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Strategy]:
+    ) -> Sequence[Strategy]:
         """Get all active strategies."""
         result = await self._session.execute(
             select(Strategy)
@@ -26,14 +50,14 @@ class StrategyRepository(BaseRepository[Strategy]):
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_type(
         self,
         strategy_type: StrategyType,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Strategy]:
+    ) -> Sequence[Strategy]:
         """Get strategies by type."""
         result = await self._session.execute(
             select(Strategy)
@@ -42,14 +66,14 @@ class StrategyRepository(BaseRepository[Strategy]):
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_market(
         self,
         market: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Strategy]:
+    ) -> Sequence[Strategy]:
         """Get strategies by market."""
         result = await self._session.execute(
             select(Strategy)
@@ -58,33 +82,28 @@ class StrategyRepository(BaseRepository[Strategy]):
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_tier(
         self,
         tier: UserTier,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Strategy]:
+    ) -> Sequence[Strategy]:
         """Get strategies available for a specific tier."""
-        tier_order = {UserTier.FREE: 0, UserTier.PRO: 1, UserTier.ENTERPRISE: 2}
-        user_tier_level = tier_order[tier]
-
-        # Get strategies where tier_required <= user's tier
+        # Strategies whose tier_required is at or below the user's tier: a
+        # range scan on idx_strategies_public_tier_level
         result = await self._session.execute(
             select(Strategy)
-            .where(Strategy.is_active == True)
-            .where(Strategy.is_public == True)
+            .where(
+                Strategy.is_active == True,
+                Strategy.is_public == True,
+                Strategy.tier_level <= TIER_LEVELS[tier],
+            )
             .offset(skip)
             .limit(limit)
         )
-
-        strategies = list(result.scalars().all())
-        # Filter by tier level
-        return [
-            s for s in strategies
-            if tier_order.get(s.tier_required, 0) <= user_tier_level
-        ]
+        return result.scalars().all()
 
     async def update_metrics(
         self,
@@ -114,24 +133,36 @@ class StrategyRepository(BaseRepository[Strategy]):
             .values(is_active=False)
         )
 
+    async def bulk_update_status(self, items: Sequence[tuple[str, bool]]) -> None:
+        """Set is_active for many strategies in one executemany UPDATE.
+
+        ``items`` is a sequence of (strategy_id, is_active) pairs; this is
+        an ORM bulk UPDATE by primary key, one round trip for the batch.
+        """
+        if not items:
+            return
+        await self._session.execute(
+            update(Strategy),
+            [{"id": strategy_id, "is_active": active} for strategy_id, active in items],
+        )
+
+    async def bulk_update_metrics(self, items: Sequence[tuple[str, dict]]) -> None:
+        """Set metrics_summary for many strategies in one executemany UPDATE."""
+        if not items:
+            return
+        await self._session.execute(
+            update(Strategy),
+            [
+                {"id": strategy_id, "metrics_summary": metrics}
+                for strategy_id, metrics in items
+            ],
+        )
+
     def to_entity(self, model: Strategy) -> StrategyEntity:
         """Convert model to entity."""
-        return StrategyEntity(
-            id=model.id,
-            version=model.version,
-            name=model.name,
-            description=model.description,
-            type=model.type,
-            markets=model.markets,
-            risk_level=model.risk_level,
-            frequency_hint=model.frequency_hint,
-            params_schema=model.params_schema,
-            default_params=model.default_params,
-            default_cooldown=model.default_cooldown,
-            metrics_summary=model.metrics_summary,
-            is_active=model.is_active,
-            is_public=model.is_public,
-            tier_required=model.tier_required,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+        return StrategyEntity(*_entity_fields(model))
+
+    def to_entities(self, models: Sequence[Strategy]) -> list[StrategyEntity]:
+        """Convert a batch of models to entities."""
+        fields = _entity_fields
+        return [StrategyEntity(*fields(m)) for m in models]
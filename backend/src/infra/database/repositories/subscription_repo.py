@@ -1,14 +1,39 @@
 """Subscription repository."""
 
+from collections import defaultdict
+from collections.abc import AsyncIterator, Mapping, Sequence
 from datetime import datetime
+from operator import attrgetter
 from uuid import UUID
 
-from sqlalchemy import select, update, func, and_
+from sqlalchemy import DateTime, String, column, lambda_stmt, select, update, func, or_, values
 
 from src.infra.database.models import Subscription
-from src.infra.database.repositories.base import BaseRepository
+from src.infra.database.repositories.base import STREAM_BATCH_SIZE, BaseRepository
 from src.domain.entities.subscription import SubscriptionEntity
 from src.core.constants import SubscriptionStatus
+from src.core.time import utcnow
+
+# Statuses that count toward a user's subscription limit
+_COUNTED_STATUSES = (SubscriptionStatus.ACTIVE, SubscriptionStatus.PAUSED)
+
+# Every SubscriptionEntity field, in declaration order
+_ENTITY_FIELDS = (
+    "id",
+    "user_id",
+    "strategy_id",
+    "params",
+    "channels",
+    "cooldown_seconds",
+    "status",
+    "last_signal_at",
+    "signal_count",
+    "created_at",
+    "updated_at",
+)
+_entity_fields = attrgetter(*_ENTITY_FIELDS)
+# The matching columns, for read-only queries that skip model hydration
+_ENTITY_COLUMNS = _entity_fields(Subscription)
 
 
 class SubscriptionRepository(BaseRepository[Subscription]):
@@ -21,33 +46,81 @@ class SubscriptionRepository(BaseRepository[Subscription]):
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Subscription]:
+    ) -> Sequence[Subscription]:
         """Get subscriptions for a user."""
-        result = await self._session.execute(
-            select(Subscription)
+        stmt = lambda_stmt(
+            lambda: select(Subscription)
             .where(Subscription.user_id == user_id)
             .order_by(Subscription.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        return list(result.scalars().all())
+        stmt += lambda s: s.offset(skip).limit(limit)
+
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
 
     async def get_active_by_user(
         self,
         user_id: UUID,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Subscription]:
+    ) -> Sequence[Subscription]:
         """Get active subscriptions for a user."""
-        result = await self._session.execute(
-            select(Subscription)
+        stmt = lambda_stmt(
+            lambda: select(Subscription)
             .where(Subscription.user_id == user_id)
             .where(Subscription.status == SubscriptionStatus.ACTIVE)
             .order_by(Subscription.created_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
-        return list(result.scalars().all())
+        stmt += lambda s: s.offset(skip).limit(limit)
+
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
+
+    async def list_and_count_by_user(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        active_only: bool = False,
+    ) -> tuple[list[SubscriptionEntity], int]:
+        """Get a page of a user's subscriptions as entities, and their total.
+
+        Read-only: plain columns are selected and turned straight into
+        entities, so no models are hydrated into the session. The total
+        rides along as ``count(*) OVER ()`` on every row, so the page and
+        the count cost one query.
+        """
+        conditions = [Subscription.user_id == user_id]
+        if active_only:
+            conditions.append(Subscription.status == SubscriptionStatus.ACTIVE)
+
+        rows = (
+            await self._session.execute(
+                select(*_ENTITY_COLUMNS, func.count().over().label("total"))
+                .where(*conditions)
+                .order_by(Subscription.created_at.desc())
+                .offset(skip)
+                .limit(limit)
+            )
+        ).all()
+        if rows:
+            return [SubscriptionEntity(*row[:-1]) for row in rows], rows[0][-1]
+        if not skip:
+            return [], 0
+
+        # Page past the end: no row carried the total
+        total = await self._session.scalar(
+            select(func.count()).select_from(Subscription).where(*conditions)
+        )
+        return [], total
+
+    async def get_strategy_ids_by_user(self, user_id: UUID) -> list[str]:
+        """Get the strategy IDs a user is subscribed to, without loading rows."""
+        stmt = lambda_stmt(
+            lambda: select(Subscription.strategy_id).where(Subscription.user_id == user_id)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars())
 
     async def get_by_strategy(
         self,
@@ -55,19 +128,17 @@ class SubscriptionRepository(BaseRepository[Subscription]):
         active_only: bool = True,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[Subscription]:
+    ) -> Sequence[Subscription]:
         """Get subscriptions for a strategy."""
-        query = select(Subscription).where(Subscription.strategy_id == strategy_id)
-
+        stmt = lambda_stmt(
+            lambda: select(Subscription).where(Subscription.strategy_id == strategy_id)
+        )
         if active_only:
-            query = query.where(Subscription.status == SubscriptionStatus.ACTIVE)
+            stmt += lambda s: s.where(Subscription.status == SubscriptionStatus.ACTIVE)
+        stmt += lambda s: s.order_by(Subscription.created_at.desc()).offset(skip).limit(limit)
 
-        result = await self._session.execute(
-            query.order_by(Subscription.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        result = await self._session.execute(stmt)
+        return result.scalars().all()
 
     async def get_by_user_and_strategy(
         self,
@@ -84,15 +155,13 @@ class SubscriptionRepository(BaseRepository[Subscription]):
 
     async def count_by_user(self, user_id: UUID) -> int:
         """Count subscriptions for a user."""
-        result = await self._session.execute(
-            select(func.count())
+        stmt = lambda_stmt(
+            lambda: select(func.count())
             .select_from(Subscription)
             .where(Subscription.user_id == user_id)
-            .where(Subscription.status.in_([
-                SubscriptionStatus.ACTIVE,
-                SubscriptionStatus.PAUSED,
-            ]))
+            .where(Subscription.status.in_(_COUNTED_STATUSES))
         )
+        result = await self._session.execute(stmt)
         return result.scalar_one()
 
     async def count_active_by_strategy(self, strategy_id: str) -> int:
@@ -111,10 +180,13 @@ class SubscriptionRepository(BaseRepository[Subscription]):
         status: SubscriptionStatus,
     ) -> None:
         """Update subscription status."""
+        # A Python timestamp, not func.now(): the ORM can then apply it to a
+        # Subscription already in the session instead of expiring the
+        # attribute, which would need a lazy (and, here, illegal) reload
         await self._session.execute(
             update(Subscription)
             .where(Subscription.id == subscription_id)
-            .values(status=status, updated_at=datetime.utcnow())
+            .values(status=status, updated_at=utcnow())
         )
 
     async def record_signal(
@@ -127,17 +199,37 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             update(Subscription)
             .where(Subscription.id == subscription_id)
             .values(
-                last_signal_at=signal_time or datetime.utcnow(),
+                last_signal_at=signal_time or utcnow(),
                 signal_count=Subscription.signal_count + 1,
-                updated_at=datetime.utcnow(),
+                updated_at=utcnow(),
             )
         )
 
+    async def record_signals_bulk(self, subscription_ids: Sequence[UUID]) -> int:
+        """Record one sent signal on each of many subscriptions at once.
+
+        One UPDATE for the whole fanout, with the increment done in the
+        row itself. Returns the number of subscriptions updated.
+        """
+        if not subscription_ids:
+            return 0
+        result = await self._session.execute(
+            update(Subscription)
+            .where(Subscription.id.in_(subscription_ids))
+            .values(
+                last_signal_at=func.now(),
+                signal_count=Subscription.signal_count + 1,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     async def get_eligible_subscriptions(
         self,
         strategy_id: str,
         cooldown_cutoff: datetime,
-    ) -> list[Subscription]:
+    ) -> Sequence[Subscription]:
         """
         Get subscriptions eligible to receive a signal.
 
@@ -148,27 +240,89 @@ class SubscriptionRepository(BaseRepository[Subscription]):
             .where(Subscription.strategy_id == strategy_id)
             .where(Subscription.status == SubscriptionStatus.ACTIVE)
             .where(
-                and_(
-                    Subscription.last_signal_at.is_(None)
-                ) | (
-                    Subscription.last_signal_at < cooldown_cutoff
+                or_(
+                    Subscription.last_signal_at.is_(None),
+                    Subscription.last_signal_at < cooldown_cutoff,
                 )
             )
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def iter_eligible_subscriptions(
+        self,
+        strategy_id: str,
+        cooldown_cutoff: datetime,
+    ) -> AsyncIterator[Subscription]:
+        """Stream the subscriptions eligible to receive a signal.
+
+        Same filter as get_eligible_subscriptions, fetched through a
+        server-side cursor ``STREAM_BATCH_SIZE`` rows at a time so a large
+        fanout never sits in memory at once.
+        """
+        stmt = (
+            select(Subscription)
+            .where(Subscription.strategy_id == strategy_id)
+            .where(Subscription.status == SubscriptionStatus.ACTIVE)
+            .where(
+                or_(
+                    Subscription.last_signal_at.is_(None),
+                    Subscription.last_signal_at < cooldown_cutoff,
+                )
+            )
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+        result = await self._session.stream_scalars(stmt)
+        try:
+            async for partition in result.partitions():
+                for sub in partition:
+                    yield sub
+        finally:
+            await result.close()
+
+    async def get_eligible_subscriptions_bulk(
+        self,
+        cooldown_cutoffs: Mapping[str, datetime],
+    ) -> dict[str, list[Subscription]]:
+        """
+        Get eligible subscriptions for several strategies in one query.
+
+        ``cooldown_cutoffs`` maps strategy_id to that strategy's cutoff; the
+        pairs are joined in as a VALUES list. Returns subscriptions grouped
+        by strategy_id, with an empty list for strategies that have none.
+        """
+        eligible: dict[str, list[Subscription]] = {sid: [] for sid in cooldown_cutoffs}
+        if not cooldown_cutoffs:
+            return eligible
+
+        cutoffs = values(
+            column("strategy_id", String),
+            column("cutoff", DateTime(timezone=True)),
+            name="cutoffs",
+        ).data(list(cooldown_cutoffs.items()))
+
+        result = await self._session.execute(
+            select(Subscription)
+            .join(cutoffs, Subscription.strategy_id == cutoffs.c.strategy_id)
+            .where(Subscription.status == SubscriptionStatus.ACTIVE)
+            .where(
+                or_(
+                    Subscription.last_signal_at.is_(None),
+                    Subscription.last_signal_at < cutoffs.c.cutoff,
+                )
+            )
+        )
+        grouped: defaultdict[str, list[Subscription]] = defaultdict(list)
+        for sub in result.scalars():
+            grouped[sub.strategy_id].append(sub)
+        eligible.update(grouped)
+        return eligible
 
     def to_entity(self, model: Subscription) -> SubscriptionEntity:
         """Convert model to entity."""
-        return SubscriptionEntity(
-            id=model.id,
-            user_id=model.user_id,
-            strategy_id=model.strategy_id,
-            params=model.params,
-            channels=model.channels,
-            cooldown_seconds=model.cooldown_seconds,
-            status=model.status,
-            last_signal_at=model.last_signal_at,
-            signal_count=model.signal_count,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+        return SubscriptionEntity(*_entity_fields(model))
+
+    def to_entities(self, models: Sequence[Subscription]) -> list[SubscriptionEntity]:
+        """Convert a batch of models to entities."""
+        fields = _entity_fields
+        return [SubscriptionEntity(*fields(m)) for m in models]
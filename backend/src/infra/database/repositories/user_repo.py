@@ -1,14 +1,41 @@
 """User repository."""
 
+from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import datetime
+from operator import attrgetter
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select, update
+from sqlalchemy import exists, select, update
 
 from src.infra.database.models import User
 from src.infra.database.repositories.base import BaseRepository
 from src.domain.entities.user import UserEntity
 from src.core.constants import UserRole, UserTier
+from src.core.time import utcnow
+
+# Users remembered per session (one session per request or task); small,
+# since a session only lives for one unit of work
+USER_CACHE_SIZE = 128
+
+# Every UserEntity field, in declaration order
+_entity_fields = attrgetter(
+    "id",
+    "email",
+    "password_hash",
+    "role",
+    "tier",
+    "nickname",
+    "avatar_url",
+    "phone",
+    "tier_expires_at",
+    "preferences",
+    "is_active",
+    "created_at",
+    "updated_at",
+    "last_login_at",
+)
 
 
 class UserRepository(BaseRepository[User]):
@@ -16,19 +43,70 @@ class UserRepository(BaseRepository[User]):
 
     model = User
 
+    def _user_cache(self) -> OrderedDict[tuple[str, Any], User]:
+        """The session's user cache, keyed by ("id", id) and ("email", email)."""
+        cache = self._session.info.get("user_cache")
+        if cache is None:
+            cache = self._session.info["user_cache"] = OrderedDict()
+        return cache
+
+    def _cached(self, key: tuple[str, Any]) -> User | None:
+        cache = self._user_cache()
+        user = cache.get(key)
+        if user is not None:
+            cache.move_to_end(key)
+        return user
+
+    def _remember(self, user: User) -> None:
+        cache = self._user_cache()
+        cache[("id", user.id)] = user
+        cache[("email", user.email)] = user
+        while len(cache) > USER_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _forget(self, user_id: UUID) -> None:
+        cache = self._user_cache()
+        user = cache.pop(("id", user_id), None)
+        if user is not None:
+            cache.pop(("email", user.email), None)
+
+    async def get_by_id(self, id: UUID | str) -> User | None:
+        """Get user by ID, memoized for the lifetime of the session."""
+        user_id = UUID(id) if isinstance(id, str) else id
+        user = self._cached(("id", user_id))
+        if user is None:
+            user = await super().get_by_id(user_id)
+            if user is not None:
+                self._remember(user)
+        return user
+
     async def get_by_email(self, email: str) -> User | None:
-        """Get user by email."""
-        result = await self._session.execute(
-            select(User).where(User.email == email)
-        )
-        return result.scalar_one_or_none()
+        """Get user by email, memoized for the lifetime of the session."""
+        user = self._cached(("email", email))
+        if user is None:
+            result = await self._session.execute(
+                select(User).where(User.email == email)
+            )
+            user = result.scalar_one_or_none()
+            if user is not None:
+                self._remember(user)
+        return user
+
+    async def delete(self, id: UUID | str) -> bool:
+        """Delete a user by ID."""
+        user_id = UUID(id) if isinstance(id, str) else id
+        self._forget(user_id)
+        return await super().delete(user_id)
 
     async def email_exists(self, email: str) -> bool:
         """Check if email exists."""
-        user = await self.get_by_email(email)
-        return user is not None
+        # A single probe of the unique email index; no row is fetched
+        result = await self._session.execute(
+            select(exists().where(User.email == email))
+        )
+        return bool(result.scalar_one())
 
-    async def get_active_users(self, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_active_users(self, skip: int = 0, limit: int = 100) -> Sequence[User]:
         """Get all active users."""
         result = await self._session.execute(
             select(User)
@@ -36,9 +114,9 @@ class UserRepository(BaseRepository[User]):
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
-    async def get_by_tier(self, tier: UserTier, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_by_tier(self, tier: UserTier, skip: int = 0, limit: int = 100) -> Sequence[User]:
         """Get users by tier."""
         result = await self._session.execute(
             select(User)
@@ -47,14 +125,15 @@ class UserRepository(BaseRepository[User]):
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def update_last_login(self, user_id: UUID) -> None:
         """Update user's last login time."""
+        self._forget(user_id)
         await self._session.execute(
             update(User)
             .where(User.id == user_id)
-            .values(last_login_at=datetime.utcnow())
+            .values(last_login_at=utcnow())
         )
 
     async def update_tier(
@@ -64,6 +143,7 @@ class UserRepository(BaseRepository[User]):
         expires_at: datetime | None = None,
     ) -> None:
         """Update user's subscription tier."""
+        self._forget(user_id)
         await self._session.execute(
             update(User)
             .where(User.id == user_id)
@@ -72,6 +152,7 @@ class UserRepository(BaseRepository[User]):
 
     async def deactivate(self, user_id: UUID) -> None:
         """Deactivate a user."""
+        self._forget(user_id)
         await self._session.execute(
             update(User)
             .where(User.id == user_id)
@@ -80,19 +161,9 @@ class UserRepository(BaseRepository[User]):
 
     def to_entity(self, model: User) -> UserEntity:
         """Convert model to entity."""
-        return UserEntity(
-            id=model.id,
-            email=model.email,
-            password_hash=model.password_hash,
-            nickname=model.nickname,
-            avatar_url=model.avatar_url,
-            phone=model.phone,
-            role=model.role,
-            tier=model.tier,
-            tier_expires_at=model.tier_expires_at,
-            preferences=model.preferences,
-            is_active=model.is_active,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-            last_login_at=model.last_login_at,
-        )
+        return UserEntity(*_entity_fields(model))
+
+    def to_entities(self, models: Sequence[User]) -> list[UserEntity]:
+        """Convert a batch of models to entities."""
+        fields = _entity_fields
+        return [UserEntity(*fields(m)) for m in models]
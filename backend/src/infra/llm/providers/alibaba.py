@@ -3,9 +3,10 @@
 支持模型: glm-4.6, qwen3-max, deepseek-v3.2, kimi-k2-thinking
 """
 
-import json
 from typing import AsyncGenerator
 
+import orjson
+
 from ..base import BaseTextProvider
 from ..types import (
     ChatMessage,
@@ -44,6 +45,12 @@ class AlibabaProvider(BaseTextProvider):
             default_model=ALIBABA_DEFAULT_MODEL,
             supported_models=ALIBABA_MODELS.copy(),
         )
+        # 请求头和端点在实例生命周期内不变, 只构造一次
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._endpoint = f"{self._base_url}/chat/completions"
 
     @property
     def provider_type(self) -> ProviderType:
@@ -71,18 +78,15 @@ class AlibabaProvider(BaseTextProvider):
             payload["top_p"] = request.top_p
 
         response = await self._client.post(
-            f"{self._base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
+            self._endpoint,
+            headers=self._headers,
+            content=orjson.dumps(payload),
         )
 
         if response.status_code != 200:
             await self._handle_response_error(response)
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return TextGenerationResponse(
             id=data["id"],
@@ -130,34 +134,32 @@ class AlibabaProvider(BaseTextProvider):
 
         async with self._client.stream(
             "POST",
-            f"{self._base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
+            self._endpoint,
+            headers=self._headers,
+            content=orjson.dumps(payload),
         ) as response:
             if response.status_code != 200:
                 await response.aread()
                 await self._handle_response_error(response)
 
-            buffer = ""
-            async for chunk in response.aiter_text():
+            # 直接按字节切行并解析, 省去中间的 str 解码
+            buffer = b""
+            async for chunk in response.aiter_bytes():
                 buffer += chunk
-                lines = buffer.split("\n")
+                lines = buffer.split(b"\n")
                 buffer = lines.pop()
 
                 for line in lines:
                     line = line.strip()
-                    if not line or not line.startswith("data: "):
+                    if not line or not line.startswith(b"data: "):
                         continue
 
                     data = line[6:]
-                    if data == "[DONE]":
+                    if data == b"[DONE]":
                         return
 
                     try:
-                        parsed = json.loads(data)
+                        parsed = orjson.loads(data)
                         yield TextStreamChunk(
                             id=parsed["id"],
                             model=parsed["model"],
@@ -173,7 +175,7 @@ class AlibabaProvider(BaseTextProvider):
                                 for choice in parsed["choices"]
                             ],
                         )
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
 
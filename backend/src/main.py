@@ -4,8 +4,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from src.core.config import settings
+from src.core.json_response import ORJSONResponse
 from src.core.logging import configure_logging, get_logger
 from src.infra.database import init_db, close_db
 from src.api.v1 import router as api_v1_router
@@ -40,6 +42,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS
@@ -51,6 +54,10 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress list payloads; small bodies are not worth the CPU. HTTP only,
+    # WebSocket frames are left uncompressed.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     # Custom middleware
     register_middleware(app)
 
@@ -78,4 +85,7 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
+        # LoggingMiddleware already emits one line per request
+        access_log=False,
+        log_config=None,
     )
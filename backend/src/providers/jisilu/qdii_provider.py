@@ -1,11 +1,11 @@
 """Jisilu QDII data provider."""
 
 import httpx
-from datetime import datetime
 from typing import Any
 
 from src.providers.base import BaseProvider, DataCapability, ProviderHealth
 from src.core.logging import get_logger
+from src.core.time import utcnow
 
 logger = get_logger(__name__)
 
@@ -65,7 +65,7 @@ class JisiluQDIIProvider(BaseProvider):
             "apply_status": cell.get("apply_status", ""),
             "redeem_status": cell.get("redeem_status", ""),
             "index_nm": cell.get("index_nm", ""),
-            "crawl_time": datetime.utcnow().isoformat(),
+            "crawl_time": utcnow().isoformat(),
         }
 
     def _parse_float(self, value: Any) -> float:
@@ -81,13 +81,13 @@ class JisiluQDIIProvider(BaseProvider):
 
     async def health_check(self) -> ProviderHealth:
         try:
-            start = datetime.utcnow()
+            start = utcnow()
             response = await self._client.head(self.BASE_URL)
-            latency = (datetime.utcnow() - start).total_seconds() * 1000
+            latency = (utcnow() - start).total_seconds() * 1000
 
             return ProviderHealth(
                 is_healthy=response.status_code == 200,
-                last_success=datetime.utcnow(),
+                last_success=utcnow(),
                 last_error=None,
                 latency_ms=latency,
             )
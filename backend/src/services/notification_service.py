@@ -1,5 +1,6 @@
 """Notification service."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from sqlalchemy import select, update, func
 
 from src.infra.database.models import Notification, DeliveryPlan
 from src.core.constants import NotificationType, DeliveryStatus, DeliveryChannel
+from src.core.time import utcnow
 
 
 class NotificationService:
@@ -45,7 +47,7 @@ class NotificationService:
         unread_only: bool = False,
         skip: int = 0,
         limit: int = 50,
-    ) -> list[Notification]:
+    ) -> Sequence[Notification]:
         """Get user's notifications."""
         query = select(Notification).where(Notification.user_id == user_id)
 
@@ -55,7 +57,56 @@ class NotificationService:
         query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
 
         result = await self._session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def get_user_notifications_page(
+        self,
+        user_id: UUID,
+        unread_only: bool = False,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[Notification], int, int]:
+        """Get a page of user's notifications with the total and unread counts.
+
+        Both counts are computed by window functions in the same query, so
+        only an empty page needs extra round-trips.
+        """
+        total_ct = func.count().over().label("total_ct")
+        unread_ct = (
+            func.count()
+            .filter(Notification.is_read == False)
+            .over()
+            .label("unread_ct")
+        )
+        query = select(Notification, total_ct, unread_ct).where(
+            Notification.user_id == user_id
+        )
+
+        if unread_only:
+            query = query.where(Notification.is_read == False)
+
+        query = query.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+
+        result = await self._session.execute(query)
+        rows = result.all()
+        if not rows:
+            unread_count = await self.get_unread_count(user_id)
+            if unread_only or skip == 0:
+                total = unread_count if unread_only else 0
+            else:
+                total = await self.count_user_notifications(user_id)
+            return [], total, unread_count
+
+        return [row[0] for row in rows], rows[0][1], rows[0][2]
+
+    async def count_user_notifications(self, user_id: UUID) -> int:
+        """Count all of a user's notifications."""
+        result = await self._session.execute(
+            select(func.count())
+            .select_from(Notification)
+            .where(Notification.user_id == user_id)
+        )
+        return result.scalar_one()
 
     async def mark_as_read(self, notification_id: UUID, user_id: UUID) -> bool:
         """Mark a notification as read."""
@@ -114,19 +165,19 @@ class NotificationService:
     async def get_pending_deliveries(
         self,
         limit: int = 100,
-    ) -> list[DeliveryPlan]:
+    ) -> Sequence[DeliveryPlan]:
         """Get pending delivery plans."""
         result = await self._session.execute(
             select(DeliveryPlan)
             .where(DeliveryPlan.status == DeliveryStatus.PENDING)
             .where(
                 (DeliveryPlan.scheduled_at.is_(None)) |
-                (DeliveryPlan.scheduled_at <= datetime.utcnow())
+                (DeliveryPlan.scheduled_at <= utcnow())
             )
             .order_by(DeliveryPlan.created_at)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def update_delivery_status(
         self,
@@ -137,7 +188,7 @@ class NotificationService:
         """Update delivery plan status."""
         values = {"status": status}
         if status == DeliveryStatus.SENT:
-            values["sent_at"] = datetime.utcnow()
+            values["sent_at"] = utcnow()
         if error_message:
             values["error_message"] = error_message
             values["retry_count"] = DeliveryPlan.retry_count + 1
@@ -10,6 +10,7 @@ from src.domain.entities.signal import SignalEntity
 from src.domain.value_objects.pagination import CursorPagination, PagedResult
 from src.core.constants import Market, SignalSide
 from src.core.exceptions import SignalNotFoundError
+from src.core.time import utcnow
 
 
 class SignalService:
@@ -54,8 +55,7 @@ class SignalService:
     ) -> PagedResult[SignalEntity]:
         """List signals for user's subscribed strategies."""
         # Get user's subscribed strategy IDs
-        subs = await self._sub_repo.get_by_user(user_id)
-        strategy_ids = [s.strategy_id for s in subs]
+        strategy_ids = await self._sub_repo.get_strategy_ids_by_user(user_id)
 
         if not strategy_ids:
             return PagedResult(items=[], has_more=False)
@@ -77,7 +77,7 @@ class SignalService:
         )
 
         return PagedResult(
-            items=[self._signal_repo.to_entity(s) for s in result.items],
+            items=self._signal_repo.to_entities(result.items),
             next_cursor=result.next_cursor,
             has_more=result.has_more,
         )
@@ -118,7 +118,7 @@ class SignalService:
         cooldown_seconds: int,
     ) -> bool:
         """Check if a signal with the same dedup key exists within cooldown."""
-        since = datetime.utcnow() - timedelta(seconds=cooldown_seconds)
+        since = utcnow() - timedelta(seconds=cooldown_seconds)
         existing = await self._signal_repo.get_recent_by_dedup_key(dedup_key, since)
         return existing is not None
 
@@ -141,5 +141,5 @@ class SignalService:
         days: int = 30,
     ) -> int:
         """Get signal count for a strategy in the last N days."""
-        since = datetime.utcnow() - timedelta(days=days)
-        return await self._signal_repo.count_by_strategy_since(strategy_id, since)
+        since = utcnow() - timedelta(days=days)
+        return await self._signal_repo.count_by_strategy_since_cached(strategy_id, since)
@@ -40,7 +40,7 @@ class StrategyService:
         else:
             strategies = await self._repo.get_active_strategies(skip, limit)
 
-        return [self._repo.to_entity(s) for s in strategies]
+        return self._repo.to_entities(strategies)
 
     async def create_strategy(
         self,
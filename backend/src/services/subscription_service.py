@@ -1,6 +1,5 @@
 """Subscription service."""
 
-from datetime import datetime
 from uuid import UUID
 
 from src.infra.database.repositories.subscription_repo import SubscriptionRepository
@@ -9,6 +8,7 @@ from src.infra.database.repositories.user_repo import UserRepository
 from src.infra.database.models import Subscription
 from src.domain.entities.subscription import SubscriptionEntity
 from src.core.constants import SubscriptionStatus, DeliveryChannel, SUBSCRIPTION_LIMITS
+from src.core.time import utcnow
 from src.core.exceptions import (
     StrategyNotFoundError,
     SubscriptionNotFoundError,
@@ -95,14 +95,11 @@ class SubscriptionService:
         active_only: bool = False,
         skip: int = 0,
         limit: int = 100,
-    ) -> list[SubscriptionEntity]:
-        """Get user's subscriptions."""
-        if active_only:
-            subs = await self._sub_repo.get_active_by_user(user_id, skip, limit)
-        else:
-            subs = await self._sub_repo.get_by_user(user_id, skip, limit)
-
-        return [self._sub_repo.to_entity(s) for s in subs]
+    ) -> tuple[list[SubscriptionEntity], int]:
+        """Get a page of user's subscriptions and the total count."""
+        return await self._sub_repo.list_and_count_by_user(
+            user_id, skip, limit, active_only=active_only
+        )
 
     async def get_by_id(self, subscription_id: UUID, user_id: UUID) -> SubscriptionEntity:
         """Get subscription by ID."""
@@ -140,7 +137,7 @@ class SubscriptionService:
         if cooldown_seconds is not None:
             sub.cooldown_seconds = cooldown_seconds
 
-        sub.updated_at = datetime.utcnow()
+        sub.updated_at = utcnow()
         updated = await self._sub_repo.update(sub)
         return self._sub_repo.to_entity(updated)
 
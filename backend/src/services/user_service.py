@@ -1,13 +1,20 @@
 """User service for authentication and user management."""
 
 from datetime import datetime
+from typing import Literal, overload
 from uuid import UUID
 
 from src.infra.database.repositories.user_repo import UserRepository
 from src.infra.database.models import User
 from src.domain.entities.user import UserEntity
-from src.core.security import hash_password, verify_password, create_access_token, create_refresh_token
+from src.core.security import (
+    create_access_token,
+    create_refresh_token,
+    hash_password_async,
+    verify_password_async,
+)
 from src.core.constants import UserRole, UserTier
+from src.core.time import utcnow
 from src.core.exceptions import (
     InvalidCredentialsError,
     EmailAlreadyExistsError,
@@ -21,32 +28,63 @@ class UserService:
     def __init__(self, user_repo: UserRepository):
         self._repo = user_repo
 
+    @overload
+    async def register(
+        self,
+        email: str,
+        password: str,
+        nickname: str | None = ...,
+        issue_tokens: Literal[False] = ...,
+    ) -> UserEntity: ...
+
+    @overload
+    async def register(
+        self,
+        email: str,
+        password: str,
+        nickname: str | None = ...,
+        *,
+        issue_tokens: Literal[True],
+    ) -> tuple[UserEntity, str, str]: ...
+
     async def register(
         self,
         email: str,
         password: str,
         nickname: str | None = None,
-    ) -> UserEntity:
-        """Register a new user."""
+        issue_tokens: bool = False,
+    ) -> UserEntity | tuple[UserEntity, str, str]:
+        """Register a new user.
+
+        With ``issue_tokens`` the new user is logged in straight away and
+        ``(user, access_token, refresh_token)`` is returned, without the
+        extra lookup and password check a separate ``authenticate`` costs.
+        """
         if await self._repo.email_exists(email):
             raise EmailAlreadyExistsError(email)
 
         user = User(
             email=email,
-            password_hash=hash_password(password),
+            password_hash=await hash_password_async(password),
             nickname=nickname or email.split("@")[0],
             role=UserRole.USER,
             tier=UserTier.FREE,
         )
+        if issue_tokens:
+            user.last_login_at = utcnow()
 
         saved = await self._repo.create(user)
-        return self._repo.to_entity(saved)
+        if not issue_tokens:
+            return self._repo.to_entity(saved)
+
+        access_token, refresh_token = self._issue_tokens(saved)
+        return self._repo.to_entity(saved), access_token, refresh_token
 
     async def authenticate(self, email: str, password: str) -> tuple[UserEntity, str, str]:
         """Authenticate user and return tokens."""
         user = await self._repo.get_by_email(email)
 
-        if not user or not verify_password(password, user.password_hash):
+        if not user or not await verify_password_async(password, user.password_hash):
             raise InvalidCredentialsError()
 
         if not user.is_active:
@@ -54,11 +92,15 @@ class UserService:
 
         await self._repo.update_last_login(user.id)
 
-        access_token = create_access_token({"sub": str(user.id), "email": user.email})
-        refresh_token = create_refresh_token({"sub": str(user.id)})
-
+        access_token, refresh_token = self._issue_tokens(user)
         return self._repo.to_entity(user), access_token, refresh_token
 
+    @staticmethod
+    def _issue_tokens(user: User) -> tuple[str, str]:
+        """Create an access/refresh token pair for a user."""
+        claims = {"sub": str(user.id), "email": user.email}
+        return create_access_token(claims), create_refresh_token(claims)
+
     async def get_by_id(self, user_id: UUID) -> UserEntity:
         """Get user by ID."""
         user = await self._repo.get_by_id(user_id)
@@ -90,7 +132,7 @@ class UserService:
         if phone is not None:
             user.phone = phone
 
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
         updated = await self._repo.update(user)
         return self._repo.to_entity(updated)
 
@@ -105,11 +147,11 @@ class UserService:
         if not user:
             raise UserNotFoundError(str(user_id))
 
-        if not verify_password(old_password, user.password_hash):
+        if not await verify_password_async(old_password, user.password_hash):
             raise InvalidCredentialsError()
 
-        user.password_hash = hash_password(new_password)
-        user.updated_at = datetime.utcnow()
+        user.password_hash = await hash_password_async(new_password)
+        user.updated_at = utcnow()
         await self._repo.update(user)
         return True
 
@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any
 
 from src.core.constants import SignalSide, Market
+from src.core.time import utcnow
 
 
 @dataclass
@@ -21,7 +22,7 @@ class Signal:
     reason_points: list[str]
     snapshot: dict[str, Any]
     risk_tags: list[str] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
     id: str | None = None
     ai_explain: str | None = None
 
@@ -31,8 +32,8 @@ class Signal:
             "strategy_id": self.strategy_id,
             "strategy_version": self.strategy_version,
             "symbol": self.symbol,
-            "market": self.market.value if isinstance(self.market, Market) else self.market,
-            "side": self.side.value if isinstance(self.side, SignalSide) else self.side,
+            "market": self.market,
+            "side": self.side,
             "confidence": self.confidence,
             "reason_points": self.reason_points,
             "risk_tags": self.risk_tags,
@@ -49,7 +50,7 @@ class StrategyContext:
     strategy_id: str
     params: dict[str, Any]
     data: dict[str, Any]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
 
     def get_data(self, key: str) -> Any:
         return self.data.get(key)
@@ -1,9 +1,20 @@
 """Celery application configuration."""
 
+import asyncio
+
 from celery import Celery
 
 from src.core.config import settings
 
+# Tasks drive their coroutines on a fresh event loop; make those uvloop
+# loops where available (it ships with uvicorn[standard], not on Windows)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 celery_app = Celery(
     "signalflow",
     broker=settings.celery_broker_url,
@@ -38,6 +49,14 @@ celery_app.conf.beat_schedule = {
         "task": "src.workers.tasks.strategy_tasks.run_all_strategies",
         "schedule": 300.0,  # Every 5 minutes
     },
+    "refresh-signal-counts": {
+        "task": "src.workers.tasks.strategy_tasks.refresh_signal_counts",
+        "schedule": 600.0,  # Every 10 minutes; picks up each finished day
+    },
+    "create-signal-partitions": {
+        "task": "src.workers.tasks.strategy_tasks.create_signal_partitions",
+        "schedule": 86400.0,  # Daily; partitions are created months ahead
+    },
     "process-deliveries": {
         "task": "src.workers.tasks.notification_tasks.process_pending_deliveries",
         "schedule": 60.0,  # Every minute
@@ -1,12 +1,12 @@
 """Data ingestion tasks."""
 
 import asyncio
-from datetime import datetime
 
 from src.workers.celery_app import celery_app
 from src.providers.jisilu.qdii_provider import JisiluQDIIProvider
 from src.providers.base import DataCapability
 from src.core.logging import get_logger
+from src.core.time import utcnow
 
 logger = get_logger(__name__)
 
@@ -37,7 +37,7 @@ def fetch_qdii_data(self):
             return {
                 "status": "success",
                 "count": len(data),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utcnow().isoformat(),
             }
         except Exception as e:
             logger.error("Failed to fetch QDII data", error=str(e))
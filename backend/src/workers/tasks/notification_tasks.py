@@ -1,12 +1,12 @@
 """Notification delivery tasks."""
 
 import asyncio
-from datetime import datetime
 from uuid import UUID
 
 from src.workers.celery_app import celery_app
 from src.core.logging import get_logger
 from src.core.constants import DeliveryStatus, DeliveryChannel
+from src.core.time import utcnow
 
 logger = get_logger(__name__)
 
@@ -134,11 +134,13 @@ def send_signal_notifications(signal_id: str, strategy_id: str):
             notification_service = NotificationService(session)
 
             # Get eligible subscriptions
-            cooldown_cutoff = datetime.utcnow() - timedelta(hours=1)
-            subs = await sub_repo.get_eligible_subscriptions(strategy_id, cooldown_cutoff)
+            cooldown_cutoff = utcnow() - timedelta(hours=1)
+            subs = sub_repo.iter_eligible_subscriptions(strategy_id, cooldown_cutoff)
 
             created = 0
-            for sub in subs:
+            notified: list[UUID] = []
+            async for sub in subs:
+                planned = False
                 for channel in sub.channels:
                     try:
                         await notification_service.create_delivery_plan(
@@ -153,8 +155,15 @@ def send_signal_notifications(signal_id: str, strategy_id: str):
                             },
                         )
                         created += 1
+                        planned = True
                     except Exception as e:
                         logger.error("Failed to create delivery plan", error=str(e))
+                # Only subscriptions that actually got a plan enter cooldown
+                if planned:
+                    notified.append(sub.id)
+
+            # Starts each subscription's cooldown, in one statement
+            await sub_repo.record_signals_bulk(notified)
 
             return {"created": created, "signal_id": signal_id}
 
@@ -1,7 +1,7 @@
 """Strategy execution tasks."""
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from src.workers.celery_app import celery_app
 from src.strategies.base import StrategyContext
@@ -10,9 +10,13 @@ from src.strategies.arbitrage.qdii_premium import QDIIPremiumStrategy
 from src.providers.jisilu.qdii_provider import JisiluQDIIProvider
 from src.providers.base import DataCapability
 from src.core.logging import get_logger
+from src.core.time import utcnow
 
 logger = get_logger(__name__)
 
+# Monthly signals partitions kept ready beyond the current month
+SIGNAL_PARTITIONS_AHEAD = 3
+
 
 def run_async(coro):
     """Run async function in sync context."""
@@ -55,7 +59,7 @@ def run_strategy(self, strategy_id: str, params: dict | None = None):
             strategy_id=strategy_id,
             params=merged_params,
             data=data,
-            timestamp=datetime.utcnow(),
+            timestamp=utcnow(),
         )
 
         # Compute signals
@@ -72,7 +76,7 @@ def run_strategy(self, strategy_id: str, params: dict | None = None):
             "strategy_id": strategy_id,
             "signal_count": len(signals),
             "signals": [s.to_dict() for s in signals],
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utcnow().isoformat(),
         }
 
     try:
@@ -95,10 +99,101 @@ def run_all_strategies():
     return {
         "status": "started",
         "strategies": results,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utcnow().isoformat(),
     }
 
 
+@celery_app.task
+def refresh_signal_counts():
+    """Refresh the daily per-strategy signal count rollup."""
+
+    async def _refresh():
+        from sqlalchemy import text
+
+        from src.infra.database.connection import get_session
+
+        async with get_session() as session:
+            await session.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_signal_counts_daily")
+            )
+
+    run_async(_refresh())
+    return {"status": "refreshed", "timestamp": utcnow().isoformat()}
+
+
+@celery_app.task
+def create_signal_partitions(months_ahead: int = SIGNAL_PARTITIONS_AHEAD):
+    """Pre-create the monthly signals partitions for the coming months.
+
+    Rows past the last monthly partition land in signals_default, so a
+    stalled beat never fails inserts. When a month's partition is created
+    late, its rows are first moved out of the default partition (which
+    would otherwise block the CREATE) and an error is logged.
+    Existing partitions are left untouched.
+    """
+
+    async def _create() -> list[str]:
+        from sqlalchemy import text
+
+        from src.infra.database.connection import get_session
+        from src.infra.database.models import Signal
+
+        # Generated columns cannot be inserted into; they are recomputed
+        columns = ", ".join(c.name for c in Signal.__table__.columns if c.computed is None)
+
+        month = utcnow().date().replace(day=1)
+        partitions = []
+        async with get_session() as session:
+            for _ in range(months_ahead + 1):
+                next_month = (month + timedelta(days=32)).replace(day=1)
+                name = f"signals_{month:%Y%m}"
+                exists = await session.scalar(text(f"SELECT to_regclass('{name}')"))
+                if exists is None:
+                    lower = f"'{month.isoformat()} 00:00+00'"
+                    upper = f"'{next_month.isoformat()} 00:00+00'"
+                    await session.execute(
+                        text(
+                            f"CREATE TEMP TABLE _moved_signals AS "
+                            f"SELECT {columns} FROM signals_default WITH NO DATA"
+                        )
+                    )
+                    moved = (
+                        await session.execute(
+                            text(
+                                f"WITH moved AS (DELETE FROM signals_default "
+                                f"WHERE created_at >= {lower} AND created_at < {upper} "
+                                f"RETURNING {columns}) "
+                                f"INSERT INTO _moved_signals SELECT * FROM moved"
+                            )
+                        )
+                    ).rowcount
+                    await session.execute(
+                        text(
+                            f"CREATE TABLE {name} PARTITION OF signals "
+                            f"FOR VALUES FROM ({lower}) TO ({upper})"
+                        )
+                    )
+                    if moved:
+                        logger.error(
+                            "Signals partition created late; rows moved from default",
+                            partition=name,
+                            rows=moved,
+                        )
+                        await session.execute(
+                            text(
+                                f"INSERT INTO signals ({columns}) "
+                                f"SELECT {columns} FROM _moved_signals"
+                            )
+                        )
+                    await session.execute(text("DROP TABLE _moved_signals"))
+                partitions.append(name)
+                month = next_month
+        return partitions
+
+    partitions = run_async(_create())
+    return {"status": "ok", "partitions": partitions}
+
+
 @celery_app.task
 def compute_strategy_metrics(strategy_id: str, days: int = 30):
     """Compute performance metrics for a strategy."""
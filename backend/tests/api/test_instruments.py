@@ -0,0 +1,43 @@
+"""Instrument listing endpoint."""
+
+from collections.abc import AsyncGenerator
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.deps import get_optional_user
+from src.api.v1.endpoints import instruments
+from src.domain.value_objects.pagination import CursorPagination
+from src.infra.database import get_db
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    app = FastAPI()
+    app.include_router(instruments.router)
+    # A rejected cursor must fail before any query runs
+    app.dependency_overrides[get_db] = lambda: AsyncMock()
+    app.dependency_overrides[get_optional_user] = lambda: None
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"id": "00000000-0000-0000-0000-000000000001"},
+        {"created_at": "2026-10-01T00:00:00+00:00"},
+        {"created_at": "yesterday", "id": "00000000-0000-0000-0000-000000000001"},
+        {"created_at": "2026-10-01T00:00:00+00:00", "id": "not-a-uuid"},
+        {"created_at": 1, "id": 2},
+    ],
+)
+async def test_malformed_cursor_is_a_bad_request(client, payload):
+    cursor = CursorPagination.encode_cursor(payload)
+
+    response = await client.get("/instruments", params={"cursor": cursor})
+
+    assert response.status_code == 400
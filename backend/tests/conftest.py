@@ -0,0 +1,68 @@
+"""Shared test fixtures.
+
+Database tests need a disposable PostgreSQL database named by the
+TEST_DATABASE_URL environment variable (an asyncpg URL); they are skipped
+when it is not set. Each test gets its own schema, dropped afterwards.
+"""
+
+import os
+import uuid
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.infra.database.models import Instrument, Signal, Strategy, Subscription, User
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+# Just the tables the repository tests touch, with their enum types
+_TABLES = [
+    User.__table__,
+    Instrument.__table__,
+    Strategy.__table__,
+    Subscription.__table__,
+    Signal.__table__,
+]
+
+# Partial indexes whose predicate spells an enum label the way the
+# migrations create the type (lowercase values); create_all's enum types use
+# the member names instead, so the predicate would not parse. The tests do
+# not depend on these indexes.
+_ENUM_PREDICATE_INDEXES = {"idx_subscriptions_eligible"}
+
+_TEST_METADATA = MetaData()
+for _table in _TABLES:
+    _copy = _table.to_metadata(_TEST_METADATA)
+    for _index in [i for i in _copy.indexes if i.name in _ENUM_PREDICATE_INDEXES]:
+        _copy.indexes.discard(_index)
+
+
+@pytest.fixture
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    admin = create_async_engine(TEST_DATABASE_URL)
+    async with admin.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA {schema}"))
+
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(_TEST_METADATA.create_all)
+            # signals is partitioned; one catch-all partition is enough here
+            await conn.execute(text("CREATE TABLE signals_default PARTITION OF signals DEFAULT"))
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+    finally:
+        await engine.dispose()
+        async with admin.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        await admin.dispose()
@@ -0,0 +1,76 @@
+"""PagedResult serialization."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import orjson
+import pytest
+
+from src.core.constants import InstrumentType, Market, SignalSide, StrategyType
+from src.domain.entities.instrument import InstrumentEntity
+from src.domain.entities.signal import SignalEntity
+from src.domain.entities.strategy import StrategyEntity
+from src.domain.entities.subscription import SubscriptionEntity
+from src.domain.value_objects.pagination import PagedResult
+
+CREATED = datetime(2026, 10, 1, 8, 30, tzinfo=UTC)
+UPDATED = datetime(2026, 10, 2, 9, 15, 30, 123456, tzinfo=UTC)
+
+
+def _subscription() -> SubscriptionEntity:
+    return SubscriptionEntity(
+        id=uuid4(),
+        user_id=uuid4(),
+        strategy_id="s1",
+        params={"threshold": 1.5},
+        last_signal_at=CREATED,
+        created_at=CREATED,
+        updated_at=UPDATED,
+    )
+
+
+def _strategy() -> StrategyEntity:
+    return StrategyEntity(
+        id="s1",
+        version="1.0",
+        name="QDII premium",
+        type=StrategyType.ARBITRAGE,
+        params_schema={"type": "object"},
+        markets=["SH"],
+        created_at=CREATED,
+        updated_at=UPDATED,
+    )
+
+
+def _instrument() -> InstrumentEntity:
+    return InstrumentEntity(
+        id=uuid4(),
+        symbol="513100",
+        name="Nasdaq ETF",
+        market=Market.SH,
+        type=InstrumentType.ETF,
+        created_at=CREATED,
+        updated_at=None,
+    )
+
+
+def _signal() -> SignalEntity:
+    return SignalEntity(
+        id=uuid4(),
+        strategy_id="s1",
+        strategy_version="1.0",
+        symbol="513100",
+        market=Market.SH,
+        side=SignalSide.BUY,
+        confidence=0.8,
+        reason_points=["premium"],
+        snapshot={"premium": 2.1},
+        created_at=UPDATED,
+    )
+
+
+@pytest.mark.parametrize("make", [_subscription, _strategy, _instrument, _signal])
+def test_json_bytes_match_dict(make):
+    page = PagedResult(items=[make(), make()], next_cursor="abc", has_more=True, total=2)
+
+    assert orjson.loads(page.to_json_bytes()) == page.to_dict()
@@ -0,0 +1,49 @@
+"""Fixtures for repository tests."""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from src.core.constants import Market, SignalSide, StrategyType
+from src.infra.database.models import Strategy
+
+STRATEGY_ID = "s1"
+
+
+@pytest.fixture
+async def strategy_id(db_session) -> str:
+    db_session.add(
+        Strategy(
+            id=STRATEGY_ID,
+            version="1.0",
+            name=STRATEGY_ID,
+            type=StrategyType.ARBITRAGE,
+            params_schema={},
+        )
+    )
+    await db_session.flush()
+    return STRATEGY_ID
+
+
+@pytest.fixture
+def signal_row(strategy_id) -> Callable[..., dict[str, Any]]:
+    """Column values for one signal of the test strategy."""
+
+    def make(created_at: datetime, **overrides: Any) -> dict[str, Any]:
+        return {
+            "strategy_id": strategy_id,
+            "strategy_version": "1.0",
+            "symbol": "513100",
+            "market": Market.SH,
+            "side": SignalSide.BUY,
+            "confidence": 0.8,
+            "reason_points": ["p"],
+            "risk_tags": [],
+            "snapshot": {},
+            "created_at": created_at,
+            **overrides,
+        }
+
+    return make
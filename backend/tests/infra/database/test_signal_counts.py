@@ -0,0 +1,60 @@
+"""count_by_strategy_since_cached against the uncached count."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from src.infra.database.models import Signal
+from src.infra.database.repositories.signal_repo import SignalRepository
+
+# Same definition as migration 008/011
+_CREATE_COUNTS_VIEW = """
+    CREATE MATERIALIZED VIEW mv_signal_counts_daily AS
+    SELECT strategy_id,
+           (created_at AT TIME ZONE 'UTC')::date AS day,
+           count(*) AS cnt
+    FROM signals
+    WHERE created_at < date_trunc('day', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+    GROUP BY strategy_id, day
+"""
+
+
+@pytest.mark.parametrize("time_zone", ["UTC", "Asia/Shanghai", "America/New_York"])
+async def test_cached_count_matches_live_count_in_any_session_time_zone(
+    db_session, strategy_id, signal_row, time_zone
+):
+    session = db_session
+
+    # Signals a few minutes either side of each of the last five UTC
+    # midnights, plus one at noon, so every day boundary is exercised
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def add_day(days_ago: int) -> None:
+        midnight = today - timedelta(days=days_ago)
+        for offset in (timedelta(minutes=-5), timedelta(minutes=5), timedelta(hours=12)):
+            session.add(Signal(**signal_row(midnight + offset)))
+
+    for days_ago in range(2, 6):
+        add_day(days_ago)
+    await session.flush()
+    await session.execute(text(_CREATE_COUNTS_VIEW))
+
+    # Rows after the view was built, as if the refresh task had not caught
+    # up: the live tail starts at a UTC midnight the view does not cover
+    add_day(1)
+    await session.flush()
+
+    await session.execute(text(f"SET TIME ZONE '{time_zone}'"))
+
+    repo = SignalRepository(session)
+    base = today.replace(tzinfo=None)
+    for since in (
+        base - timedelta(days=4),
+        base - timedelta(days=4, minutes=10),
+        base - timedelta(days=3, hours=-6),
+        base - timedelta(days=1, minutes=1),
+    ):
+        assert await repo.count_by_strategy_since_cached(strategy_id, since) == (
+            await repo.count_by_strategy_since(strategy_id, since)
+        ), since
@@ -0,0 +1,27 @@
+"""Duplicate detection through the generated dedup_hash column."""
+
+from datetime import UTC, datetime, timedelta
+
+from src.infra.database.models import Signal
+from src.infra.database.repositories.signal_repo import SignalRepository
+
+
+async def test_bulk_inserted_signal_is_found_by_dedup_key(db_session, signal_row):
+    repo = SignalRepository(db_session)
+    now = datetime.now(UTC)
+    # Core executemany insert: no ORM attribute events run
+    await repo.bulk_create([signal_row(now, dedup_key="s1:513100:buy")])
+
+    found = await repo.get_recent_by_dedup_key("s1:513100:buy", now - timedelta(hours=1))
+
+    assert found is not None
+    assert found.dedup_hash is not None
+
+
+async def test_orm_inserted_signal_is_found_by_dedup_key(db_session, signal_row):
+    repo = SignalRepository(db_session)
+    now = datetime.now(UTC)
+    await repo.create(Signal(**signal_row(now, dedup_key="s1:513100:sell")))
+
+    assert await repo.get_recent_by_dedup_key("s1:513100:sell", now - timedelta(hours=1))
+    assert await repo.get_recent_by_dedup_key("s1:513100:buy", now - timedelta(hours=1)) is None
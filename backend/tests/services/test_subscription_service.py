@@ -0,0 +1,57 @@
+"""Subscription status changes through the service."""
+
+import uuid
+
+import pytest
+
+from src.core.constants import StrategyType, SubscriptionStatus
+from src.core.exceptions import SubscriptionNotFoundError
+from src.infra.database.models import Strategy, Subscription, User
+from src.infra.database.repositories.strategy_repo import StrategyRepository
+from src.infra.database.repositories.subscription_repo import SubscriptionRepository
+from src.infra.database.repositories.user_repo import UserRepository
+from src.services.subscription_service import SubscriptionService
+
+
+@pytest.fixture
+async def subscription(db_session) -> Subscription:
+    user = User(email="pause@example.com", password_hash="x")
+    strategy = Strategy(
+        id="s1",
+        version="1.0",
+        name="s1",
+        type=StrategyType.ARBITRAGE,
+        params_schema={},
+    )
+    db_session.add_all([user, strategy])
+    await db_session.flush()
+    sub = Subscription(user_id=user.id, strategy_id=strategy.id)
+    db_session.add(sub)
+    await db_session.flush()
+    return sub
+
+
+@pytest.fixture
+def service(db_session) -> SubscriptionService:
+    return SubscriptionService(
+        SubscriptionRepository(db_session),
+        StrategyRepository(db_session),
+        UserRepository(db_session),
+    )
+
+
+async def test_pause_and_resume_return_the_updated_entity(service, subscription):
+    # The subscription stays in the session's identity map, as in a request
+    # that loaded it first; the returned entity must not need a reload
+    paused = await service.pause(subscription.id, subscription.user_id)
+    assert paused.status == SubscriptionStatus.PAUSED
+    assert paused.updated_at is not None
+
+    resumed = await service.resume(subscription.id, subscription.user_id)
+    assert resumed.status == SubscriptionStatus.ACTIVE
+    assert resumed.updated_at >= paused.updated_at
+
+
+async def test_pause_rejects_another_users_subscription(service, subscription):
+    with pytest.raises(SubscriptionNotFoundError):
+        await service.pause(subscription.id, uuid.uuid4())